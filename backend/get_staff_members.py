@@ -208,6 +208,30 @@ def get_staff_member_by_id(staff_id: int) -> Optional[StaffMember]:
     return None
 
 
+def get_staff_members_by_ids(staff_ids) -> Dict[int, StaffMember]:
+    """
+    Get several staff members in a single backend round-trip.
+
+    Use this instead of calling get_staff_member_by_id in a loop — each of
+    those calls refetches the full staff list from the API.
+
+    Args:
+        staff_ids: Iterable of staff member IDs to find
+
+    Returns:
+        Dict mapping each found ID to its StaffMember object; IDs that do
+        not exist are simply absent
+    """
+    wanted = set(staff_ids)
+    if not wanted:
+        return {}
+    return {
+        member.id: member
+        for member in get_all_staff_members()
+        if member.id in wanted
+    }
+
+
 def get_staff_by_department(department: Department) -> List[StaffMember]:
     """
     Get all staff members in a specific department.
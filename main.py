@@ -1,8 +1,11 @@
 # main.py - Schedule Generation Engine Entry Point with Enhanced Logging
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
 from datetime import datetime
@@ -25,6 +28,7 @@ from schedule_format import (
 )
 from schedule_validator import ScheduleValidator
 from scheduler import SchedulingEngine
+from utils.api_academics import clear_course_cache
 from utils.api_schedule import convert_assignments_to_api_format
 from utils.room_utils import get_room_key
 
@@ -229,6 +233,12 @@ class ScheduleGenerationEngine:
         """Main execution method"""
         try:
             setup_logging()
+
+            # Drop the cross-run course/academic-list caches so a
+            # long-running server picks up upstream edits; the caching is
+            # only meant to deduplicate fetches within a single run
+            clear_course_cache()
+
             self.logger.info("=== STARTING SCHEDULE GENERATION ENGINE ===")
             self.progress.update_progress(0, "Starting schedule generation engine")
 
@@ -718,35 +728,85 @@ class ScheduleGenerationEngine:
             json.dump(schedule_data, f, indent=2, ensure_ascii=False)
 
 
+# Live logging machinery from the most recent setup_logging() call.
+# setup_logging runs once per generation request, so the previous
+# listener thread and file handlers must be torn down first or every
+# request leaks a thread blocked on an orphaned queue.
+_log_listener = None
+_log_buffered_handler = None
+_log_file_handler = None
+
+
+def _shutdown_logging():
+    """Stop the queue listener and close the file handlers, if any."""
+    global _log_listener, _log_buffered_handler, _log_file_handler
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    if _log_buffered_handler is not None:
+        _log_buffered_handler.close()
+        _log_buffered_handler = None
+    if _log_file_handler is not None:
+        _log_file_handler.close()
+        _log_file_handler = None
+
+
+atexit.register(_shutdown_logging)
+
+
 def setup_logging():
     """Setup comprehensive logging configuration - everything goes to debug.log"""
+    global _log_listener, _log_buffered_handler, _log_file_handler
 
-    # Remove any existing handlers to prevent duplicates
+    # Remove any existing handlers to prevent duplicates, and tear down
+    # the previous run's listener thread and file handlers
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _shutdown_logging()
 
     # Create detailed formatter
     detailed_formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
     )
 
-    # File handler for ALL logging - this is what you'll send to me
+    # File handler for ALL logging - this is what you'll send to me.
+    # Wrapped in a MemoryHandler so DEBUG-volume runs batch their writes
+    # into large chunks instead of one syscall per record; WARNING and
+    # above flush immediately, and atexit drains whatever is buffered.
     file_handler = logging.FileHandler(
         "scheduler_debug_full.log", mode="w", encoding="utf-8"
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.WARNING, target=file_handler
+    )
 
     # Console handler (minimal output)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 
+    # Producers only enqueue records; a background listener thread does
+    # the formatting and I/O, so hot conversion/scheduling loops never
+    # block on a file or console write
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    # Remember the live machinery so the next call (or process exit via
+    # the module-level atexit hook) can stop and close it
+    _log_listener = listener
+    _log_buffered_handler = buffered_handler
+    _log_file_handler = file_handler
+
     # Configure root logger to capture EVERYTHING
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)
 
     # Force all loggers to DEBUG level
     loggers = [
@@ -774,12 +834,12 @@ def setup_logging():
         logger.setLevel(logging.DEBUG)
         logger.propagate = True  # Ensure logs propagate to root logger
 
-    # Log the setup
-    setup_logger = logging.getLogger("LogSetup")
-    setup_logger.info("=== COMPREHENSIVE LOGGING SETUP COMPLETE ===")
-    setup_logger.info("All logs will be saved to: scheduler_debug_full.log")
-    setup_logger.info("This file will contain ALL debugging information")
-    setup_logger.info("=" * 60)
+    # Log the setup — one record instead of one per line
+    logging.getLogger("LogSetup").info(
+        "=== COMPREHENSIVE LOGGING SETUP COMPLETE ===\n"
+        "All logs will be saved to: scheduler_debug_full.log\n"
+        "This file will contain ALL debugging information\n" + "=" * 60
+    )
 
 
 @app.post("/generate")
@@ -2,10 +2,11 @@
 
 
 import logging
-from copy import deepcopy
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import time
-from typing import Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 from models.block import Assignment, Block
 from models.halls import Hall
@@ -55,11 +56,49 @@ class ConstraintManager:
         self.setup_constraints()
 
     def initialize_fresh_state(self):
-        """Initialize completely empty state"""
+        """Initialize completely empty state.
+
+        After the first call this unwinds the committed assignments from
+        the trail instead of reallocating every index — O(#assignments)
+        per attempt with no allocator churn.
+        """
+        if getattr(self, "_trail", None):
+            while self._trail:
+                self.undo_assignment(self._trail.pop())
+            self.logger.info("ConstraintManager state initialized fresh")
+            return
+
         self.state = SchedulerState.create_empty()
         self.current_assignments = {}
+        # (day, start_time) -> [(block_id, assignment)], maintained
+        # incrementally so verification is a lookup instead of a rebuild
+        self._time_index = defaultdict(list)
+        # Block ids in commit order, popped to unwind an attempt
+        self._trail = []
         self.logger.info("ConstraintManager state initialized fresh")
 
+    def snapshot(self) -> int:
+        """Mark the current trail position for a later rollback.
+
+        Assignments commit through the trail, so a snapshot is just the
+        trail length — no state is copied. Cheap enough to take before
+        every speculative move in local search.
+        """
+        return len(self._trail)
+
+    def rollback_to(self, marker: int):
+        """Undo every assignment committed since ``snapshot()`` returned
+        ``marker``, restoring all indices to that point."""
+        while len(self._trail) > marker:
+            self.undo_assignment(self._trail.pop())
+
+    @property
+    def time_index(self) -> Mapping:
+        """Assignments bucketed by (day, start_time), kept up to date on
+        every commit — verification passes read this instead of rescanning
+        the full assignment dict."""
+        return self._time_index
+
     def can_assign(
         self, block, slot: TimePreference, room: Union[Hall, Lab]
     ) -> Tuple[bool, Optional[str]]:
@@ -88,9 +127,6 @@ class ConstraintManager:
         """ATOMIC OPERATION: Check constraints and commit assignment in one step"""
         self.logger.debug(f"=== MAKING ASSIGNMENT {block_id} ===")
 
-        current_state_snapshot = deepcopy(self.state)
-        current_assignments_snapshot = self.current_assignments.copy()
-
         if block_id in self.current_assignments:
             self.logger.warning(
                 f"Block {block_id} is already assigned — skipping reassignment."
@@ -101,9 +137,9 @@ class ConstraintManager:
             self._add_to_state(block_id, assignment)
             return True
         except Exception as e:
-            # CRITICAL: Rollback to snapshot on ANY failure
-            self.state = current_state_snapshot
-            self.current_assignments = current_assignments_snapshot
+            # _add_to_state validates everything before its first mutation,
+            # so a failure here leaves no partial state behind — no deepcopy
+            # snapshot/rollback needed per commit
             self.logger.error(f"Assignment failed: {str(e)}")
             return False
 
@@ -147,8 +183,23 @@ class ConstraintManager:
         """Get all current assignments"""
         return self.current_assignments.copy()
 
+    @property
+    def assignments_view(self) -> Mapping[str, Assignment]:
+        """Read-only live view of the current assignments.
+
+        Unlike get_all_assignments this makes no copy, so hot read-only
+        callers (scoring, slot filtering) should prefer it. The proxy
+        tracks the underlying dict, so re-fetch it after
+        initialize_fresh_state rebinds the assignment map.
+        """
+        return MappingProxyType(self.current_assignments)
+
     def _add_to_state(self, block_id: str, assignment: Assignment):
-        """Add assignment to internal state tracking"""
+        """Add assignment to internal state tracking.
+
+        All conflict checks run before the first mutation, so a raise here
+        never leaves partial state behind.
+        """
         self._verify_no_conflicts_before_commit(assignment)
 
         block = assignment.block
@@ -156,42 +207,34 @@ class ConstraintManager:
         room_key = get_room_key(
             assignment.room
         )  # This returns (room_type, room_id) tuple
+        staff_id = block.staff_member.id
 
         if block_id in self.current_assignments:
             raise Exception(f"Block {block_id} already assigned — invalid state")
 
-        self.logger.debug(f"Adding {block_id} to state:")
-        self.logger.debug(f"  Room key: {room_key}")
-        self.logger.debug(f"  Slot key: {slot_key}")
-        self.logger.debug(f"  Staff ID: {block.staff_member.id}")
-
-        # Store the assignment
-        self.current_assignments[block_id] = assignment
-
-        # Update room bookings (using composite key)
-        if room_key not in self.state.room_bookings:
-            self.state.room_bookings[room_key] = {}
-
-        if slot_key in self.state.room_bookings[room_key]:
-            existing_block = self.state.room_bookings[room_key][slot_key]
+        room_slots = self.state.room_bookings.setdefault(room_key, {})
+        if slot_key in room_slots:
+            existing_block = room_slots[slot_key]
             raise Exception(
                 f"Room conflict: {room_key} at {slot_key} already has {existing_block}"
             )
 
-        self.state.room_bookings[room_key][slot_key] = block_id
-
-        # Update staff bookings
-        staff_id = block.staff_member.id
-        if staff_id not in self.state.staff_bookings:
-            self.state.staff_bookings[staff_id] = {}
-
-        if slot_key in self.state.staff_bookings[staff_id]:
-            existing_block = self.state.staff_bookings[staff_id][slot_key]
+        staff_slots = self.state.staff_bookings.setdefault(staff_id, {})
+        if slot_key in staff_slots:
+            existing_block = staff_slots[slot_key]
             raise Exception(
                 f"Staff conflict: {staff_id} at {slot_key} already has {existing_block}"
             )
 
-        self.state.staff_bookings[staff_id][slot_key] = block_id
+        self.logger.debug(f"Adding {block_id} to state:")
+        self.logger.debug(f"  Room key: {room_key}")
+        self.logger.debug(f"  Slot key: {slot_key}")
+        self.logger.debug(f"  Staff ID: {staff_id}")
+
+        # All checks passed — commit (nothing below can raise)
+        self.current_assignments[block_id] = assignment
+        room_slots[slot_key] = block_id
+        staff_slots[slot_key] = block_id
 
         # Update other state tracking (unchanged)
         if block.course_object.course_code not in self.state.course_slots:
@@ -219,6 +262,81 @@ class ConstraintManager:
             self.state.study_plan_slots[study_plan_key] = []
         self.state.study_plan_slots[study_plan_key].append(block_id)
 
+        self._time_index[slot_key].append((block_id, assignment))
+        self._trail.append(block_id)
+
+    def undo_assignment(self, block_id: str) -> bool:
+        """Remove a committed assignment and every booking it created.
+
+        Empty per-key containers are dropped so the state is
+        indistinguishable from one that never held the assignment.
+        """
+        assignment = self.current_assignments.pop(block_id, None)
+        if assignment is None:
+            self.logger.debug(f"Cannot undo {block_id}: not assigned")
+            return False
+
+        block = assignment.block
+        day = assignment.time_slot.day
+        start_time = assignment.time_slot.start_time
+        slot_key = (day, start_time)
+        room_key = get_room_key(assignment.room)
+        staff_id = block.staff_member.id
+
+        room_slots = self.state.room_bookings.get(room_key)
+        if room_slots is not None:
+            room_slots.pop(slot_key, None)
+            if not room_slots:
+                del self.state.room_bookings[room_key]
+
+        staff_slots = self.state.staff_bookings.get(staff_id)
+        if staff_slots is not None:
+            staff_slots.pop(slot_key, None)
+            if not staff_slots:
+                del self.state.staff_bookings[staff_id]
+
+        course_code = block.course_object.course_code
+        course_slots = self.state.course_slots.get(course_code)
+        if course_slots is not None:
+            count = course_slots.get(slot_key, 0) - 1
+            if count > 0:
+                course_slots[slot_key] = count
+            else:
+                course_slots.pop(slot_key, None)
+            if not course_slots:
+                del self.state.course_slots[course_code]
+
+        level_key = (block.academic_list, block.academic_level)
+        day_map = self.state.level_slots.get(level_key)
+        if day_map is not None:
+            times = day_map.get(day)
+            if times is not None:
+                if start_time in times:
+                    times.remove(start_time)
+                if not times:
+                    del day_map[day]
+            if not day_map:
+                del self.state.level_slots[level_key]
+
+        study_plan_key = (block.academic_list, day, start_time)
+        plan_blocks = self.state.study_plan_slots.get(study_plan_key)
+        if plan_blocks is not None:
+            if block_id in plan_blocks:
+                plan_blocks.remove(block_id)
+            if not plan_blocks:
+                del self.state.study_plan_slots[study_plan_key]
+
+        bucket = self._time_index.get(slot_key)
+        if bucket is not None:
+            for i, (bucket_id, _) in enumerate(bucket):
+                if bucket_id == block_id:
+                    del bucket[i]
+                    break
+            if not bucket:
+                del self._time_index[slot_key]
+
+        return True
+
     def _verify_no_conflicts_before_commit(self, new_assignment):
         """Explicitly check for conflicts before adding to state"""
         day, time = new_assignment.time_slot.day, new_assignment.time_slot.start_time
@@ -358,6 +476,30 @@ class ConstraintManager:
             total_score += score * constraint["weight"]
         return total_score
 
+    def evaluate_soft_constraints_batch(self, assignments) -> List[float]:
+        """Weighted soft-constraint score for each assignment, in one pass.
+
+        The constraint functions and weights are unpacked into a local list
+        once, so scoring N assignments costs N x #constraints plain calls
+        instead of re-reading the constraint dicts per assignment — this is
+        the bulk path behind schedule evaluation, which runs after every
+        attempt and every accepted local-search swap.
+        """
+        weighted_funcs = [
+            (constraint["func"], constraint["weight"])
+            for constraint in self.soft_constraints
+        ]
+        scores = []
+        for assignment in assignments:
+            block = assignment.block
+            slot = assignment.time_slot
+            room = assignment.room
+            total = 0.0
+            for func, weight in weighted_funcs:
+                total += func(block, slot, room) * weight
+            scores.append(total)
+        return scores
+
     # Hard Constraints
     def check_room_availability(
         self, block, slot: TimePreference, room: Union[Hall, Lab]
@@ -4,7 +4,7 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import time
-from typing import Dict, List, Set, Tuple, Union
+from typing import Dict, Iterator, List, Set, Tuple, Union
 
 from models.halls import Hall
 from models.labs import Lab
@@ -25,6 +25,12 @@ class ResourcePool:
     time_slots: List[TimePreference]
 
 
+# Generated slot lists keyed by (time_slot_duration, break_duration).
+# The generator only branches on these two constants, so the result can be
+# computed once per configuration and shared by every ResourceManager.
+_TIME_SLOT_CACHE: Dict[Tuple[int, int], List[TimePreference]] = {}
+
+
 class ResourceManager:
     def __init__(
         self,
@@ -50,6 +56,30 @@ class ResourceManager:
         self.room_usage = defaultdict(int)  # Change: single dict with composite keys
         self.staff_workload = defaultdict(int)
 
+        # (day, start_time) frozensets per room/staff member, keyed by id()
+        # of the owning object — availability and timing preferences never
+        # change during scheduling, so the sets are built once instead of
+        # on every get_available_slots call
+        self._room_slot_cache: Dict[int, frozenset] = {}
+        self._staff_slot_cache: Dict[int, frozenset] = {}
+
+    def _room_slots(self, room: Union[Hall, Lab]) -> frozenset:
+        slots = self._room_slot_cache.get(id(room))
+        if slots is None:
+            slots = self._room_slot_cache[id(room)] = frozenset(
+                (slot.day, slot.start_time) for slot in room.availability
+            )
+        return slots
+
+    def _staff_slots(self, staff_member: StaffMember) -> frozenset:
+        slots = self._staff_slot_cache.get(id(staff_member))
+        if slots is None:
+            slots = self._staff_slot_cache[id(staff_member)] = frozenset(
+                (slot.day, slot.start_time)
+                for slot in staff_member.timing_preferences
+            )
+        return slots
+
     def _categorize_labs(self):
         """Categorize labs into general and specialist pools"""
         for lab_id, lab in self.labs.items():
@@ -61,6 +91,11 @@ class ResourceManager:
 
     def _generate_time_slots(self) -> List[TimePreference]:
         """Generate all possible time slots with proper breaks"""
+        cache_key = (self.time_slot_duration, self.break_duration)
+        cached = _TIME_SLOT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         time_slots = []
         working_days = [
             Day.SUNDAY,
@@ -97,6 +132,7 @@ class ResourceManager:
                 else:
                     current_time = time(current_time.hour + self.time_slot_duration, 0)
 
+        _TIME_SLOT_CACHE[cache_key] = time_slots
         return time_slots
 
     def get_suitable_rooms(
@@ -141,24 +177,33 @@ class ResourceManager:
         self, block, room: Union[Hall, Lab], existing_assignments: Dict
     ) -> List[TimePreference]:
         """Get available time slots for a block in a specific room"""
-        available_slots = []
+        return list(self.iter_available_slots(block, room, existing_assignments))
 
-        # Get room's base availability
-        base_slots = set((slot.day, slot.start_time) for slot in room.availability)
-
-        # Remove slots that are already assigned
+    def iter_available_slots(
+        self, block, room: Union[Hall, Lab], existing_assignments: Dict
+    ) -> Iterator[TimePreference]:
+        """Lazily yield available time slots for a block in a specific room.
+
+        Callers that only need the first workable slot can stop consuming
+        early instead of paying for the full list; ``get_available_slots``
+        stays available for callers that genuinely need counts.
+        """
+        # Get room's base availability (cached frozenset per room)
+        base_slots = self._room_slots(room)
+
+        # Remove slots that are already assigned. Compare composite room keys
+        # instead of room objects — dataclass equality would walk the whole
+        # availability list on every existing assignment.
+        room_key = get_room_key(room)
         used_slots = set()
         for assignment in existing_assignments.values():
-            if assignment.room == room:
+            if get_room_key(assignment.room) == room_key:
                 used_slots.add(
                     (assignment.time_slot.day, assignment.time_slot.start_time)
                 )
 
-        # Get staff member's availability
-        staff_slots = set(
-            (slot.day, slot.start_time)
-            for slot in block.staff_member.timing_preferences
-        )
+        # Get staff member's availability (cached frozenset per staff member)
+        staff_slots = self._staff_slots(block.staff_member)
 
         # Find available slots (intersection of all constraints)
         available_slot_tuples = base_slots - used_slots
@@ -171,14 +216,10 @@ class ResourceManager:
             # For lecturers, strictly follow their preferences
             available_slot_tuples = available_slot_tuples.intersection(staff_slots)
 
-        # Convert back to TimePreference objects
+        # Convert to TimePreference objects one at a time
         for day, start_time in available_slot_tuples:
             end_time = time(start_time.hour + self.time_slot_duration, 0)
-            available_slots.append(
-                TimePreference(day=day, start_time=start_time, end_time=end_time)
-            )
-
-        return available_slots
+            yield TimePreference(day=day, start_time=start_time, end_time=end_time)
 
     def update_resource_usage(self, assignment):
         """Update usage statistics after making an assignment"""
@@ -7,7 +7,7 @@ from typing import List, Optional
 from models.department import Department
 
 
-@dataclass
+@dataclass(slots=True)
 class Course:
     id: int
     code: str
@@ -18,7 +18,8 @@ class Course:
     credit_hours: int
     prerequisite_course: Optional[str] = None
 
-    def __post_init__(self):
+    def validate(self):
+        """Opt-in consistency checks, skipped on bulk loads for speed."""
         if self.lecture_hours < 0 or self.practical_hours < 0 or self.credit_hours < 0:
             raise ValueError("Hours cannot be negative")
         if self.credit_hours != self.lecture_hours + (self.practical_hours / 2):
@@ -27,7 +28,7 @@ class Course:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class AcademicList:
     id: int
     name: str
@@ -17,7 +17,7 @@ class BlockType(Enum):
     LAB = "lab"
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     id: str  # unique identifier
     course_code: str
@@ -36,7 +36,7 @@ class Block:
     preferred_rooms: Optional[List[Union[Hall, Lab]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     block: Block
     time_slot: TimePreference
@@ -1,13 +1,17 @@
 # models/halls.py
 
 from dataclasses import dataclass
-from typing import List
+from typing import ClassVar, List
 
 from models.time_preferences import BaseAvailability, TimePreference
 
 
-@dataclass
+@dataclass(slots=True)
 class Hall:
+    # Tag used in composite room keys; a class attribute load is cheaper
+    # than an isinstance check in the scheduling loops
+    ROOM_TYPE: ClassVar[str] = "hall"
+
     id: int
     name: str
     capacity: int
@@ -3,7 +3,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import ClassVar, List
 
 from models.time_preferences import BaseAvailability, TimePreference
 
@@ -13,8 +13,11 @@ class LabType(Enum):
     SPECIALIST = "specialist"
 
 
-@dataclass
+@dataclass(slots=True)
 class Lab:
+    # Tag used in composite room keys, mirroring Hall.ROOM_TYPE
+    ROOM_TYPE: ClassVar[str] = "lab"
+
     id: int
     name: str
     capacity: int
@@ -31,103 +34,35 @@ class Lab:
 
 # Labs Seeding
 
-L401 = Lab(
-    1, "401", 25, BaseAvailability.generate_base_availability(), LabType.SPECIALIST
-)
-L402 = Lab(
-    2, "402", 25, BaseAvailability.generate_base_availability(), LabType.SPECIALIST
-)
-L403 = Lab(3, "403", 23, BaseAvailability.generate_base_availability(), LabType.GENERAL)
-L407 = Lab(
-    4, "407", 36, BaseAvailability.generate_base_availability(), LabType.SPECIALIST
-)
-L408 = Lab(
-    5, "408", 23, BaseAvailability.generate_base_availability(), LabType.SPECIALIST
-)
-L409 = Lab(
-    6, "409", 22, BaseAvailability.generate_base_availability(), LabType.SPECIALIST
-)
-L410 = Lab(
-    7,
-    "410",
-    15,
-    BaseAvailability.generate_base_availability(),
-    LabType.SPECIALIST,
-    False,
-)
-L411 = Lab(
-    8, "411", 25, BaseAvailability.generate_base_availability(), LabType.SPECIALIST
-)
-L412 = Lab(
-    9,
-    "412",
-    12,
-    BaseAvailability.generate_base_availability(),
-    LabType.SPECIALIST,
-    False,
-)
-L413 = Lab(
-    23,
-    "413",
-    25,
-    BaseAvailability.generate_base_availability(),
-    LabType.SPECIALIST,
-    False,
-)
-
-L201 = Lab(
-    10, "201", 33, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L202 = Lab(
-    11, "202", 24, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L203 = Lab(
-    12, "203", 25, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L204 = Lab(
-    13, "204", 25, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L205 = Lab(
-    14, "205", 28, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L206 = Lab(
-    15,
-    "206",
-    10,
-    BaseAvailability.generate_base_availability(),
-    LabType.SPECIALIST,
-    False,
-)
-L207 = Lab(
-    16, "207", 38, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L208 = Lab(
-    17, "208", 25, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L209 = Lab(
-    18, "209", 24, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L210 = Lab(
-    19, "210", 25, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L211 = Lab(
-    20, "211", 24, BaseAvailability.generate_base_availability(), LabType.GENERAL
-)
-L213 = Lab(
-    21,
-    "213",
-    25,
-    BaseAvailability.generate_base_availability(),
-    LabType.SPECIALIST,
-    False,
-)
-L214 = Lab(
-    22,
-    "214",
-    25,
-    BaseAvailability.generate_base_availability(),
-    LabType.GENERAL,
-)
+# All seeded labs share the same base availability. Generating it once and
+# sharing the list (and its TimePreference objects) avoids building ~25
+# identical slot objects per lab and lets equality checks hit identity fast.
+_BASE_AVAIL = BaseAvailability.generate_base_availability()
+
+L401 = Lab(1, "401", 25, _BASE_AVAIL, LabType.SPECIALIST)
+L402 = Lab(2, "402", 25, _BASE_AVAIL, LabType.SPECIALIST)
+L403 = Lab(3, "403", 23, _BASE_AVAIL, LabType.GENERAL)
+L407 = Lab(4, "407", 36, _BASE_AVAIL, LabType.SPECIALIST)
+L408 = Lab(5, "408", 23, _BASE_AVAIL, LabType.SPECIALIST)
+L409 = Lab(6, "409", 22, _BASE_AVAIL, LabType.SPECIALIST)
+L410 = Lab(7, "410", 15, _BASE_AVAIL, LabType.SPECIALIST, False)
+L411 = Lab(8, "411", 25, _BASE_AVAIL, LabType.SPECIALIST)
+L412 = Lab(9, "412", 12, _BASE_AVAIL, LabType.SPECIALIST, False)
+L413 = Lab(23, "413", 25, _BASE_AVAIL, LabType.SPECIALIST, False)
+
+L201 = Lab(10, "201", 33, _BASE_AVAIL, LabType.GENERAL)
+L202 = Lab(11, "202", 24, _BASE_AVAIL, LabType.GENERAL)
+L203 = Lab(12, "203", 25, _BASE_AVAIL, LabType.GENERAL)
+L204 = Lab(13, "204", 25, _BASE_AVAIL, LabType.GENERAL)
+L205 = Lab(14, "205", 28, _BASE_AVAIL, LabType.GENERAL)
+L206 = Lab(15, "206", 10, _BASE_AVAIL, LabType.SPECIALIST, False)
+L207 = Lab(16, "207", 38, _BASE_AVAIL, LabType.GENERAL)
+L208 = Lab(17, "208", 25, _BASE_AVAIL, LabType.GENERAL)
+L209 = Lab(18, "209", 24, _BASE_AVAIL, LabType.GENERAL)
+L210 = Lab(19, "210", 25, _BASE_AVAIL, LabType.GENERAL)
+L211 = Lab(20, "211", 24, _BASE_AVAIL, LabType.GENERAL)
+L213 = Lab(21, "213", 25, _BASE_AVAIL, LabType.SPECIALIST, False)
+L214 = Lab(22, "214", 25, _BASE_AVAIL, LabType.GENERAL)
 
 Labs = [
     L401,
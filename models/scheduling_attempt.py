@@ -1,15 +1,88 @@
 # models/scheduling_attempt.py
 
-from dataclasses import dataclass
-from typing import Dict, Set
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Union
 
-from models.block import Assignment
+from models.block import Assignment, Block
+from models.halls import Hall
+from models.labs import Lab
+from models.time_preferences import TimePreference
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulingAttempt:
-    """Represents a single scheduling attempt with its score"""
+    """Represents a single scheduling attempt with its score.
 
-    assignments: Dict[str, Assignment]
-    score: float
-    unassigned_blocks: Set[str]
+    Assignments are stored as parallel arrays (structure-of-arrays):
+    blocks, rooms and time slots live in flat lists sharing one index,
+    with a block_id -> index map for lookups. Copying or diffing an
+    attempt is then a handful of flat list copies instead of a per-item
+    dict copy, and scoring can walk the compact arrays directly. The
+    legacy Dict[str, Assignment] shape is only materialized on demand
+    for export.
+    """
+
+    blocks: List[Block] = field(default_factory=list)
+    rooms: List[Union[Hall, Lab]] = field(default_factory=list)
+    slots: List[TimePreference] = field(default_factory=list)
+    score: float = 0.0
+    unassigned_blocks: Set[str] = field(default_factory=set)
+    _index: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_assignments(
+        cls,
+        assignments: Dict[str, Assignment],
+        score: float,
+        unassigned_blocks: Set[str],
+    ) -> "SchedulingAttempt":
+        """Build an attempt from the scheduler's assignment map."""
+        attempt = cls(score=score, unassigned_blocks=unassigned_blocks)
+        for block_id, assignment in assignments.items():
+            attempt.set(block_id, assignment.block, assignment.time_slot, assignment.room)
+        return attempt
+
+    def get(self, block_id: str) -> Assignment:
+        """Get the assignment for a block id"""
+        i = self._index[block_id]
+        return Assignment(self.blocks[i], self.slots[i], self.rooms[i])
+
+    def set(
+        self,
+        block_id: str,
+        block: Block,
+        slot: TimePreference,
+        room: Union[Hall, Lab],
+    ):
+        """Add or replace the assignment for a block id"""
+        i = self._index.get(block_id)
+        if i is None:
+            self._index[block_id] = len(self.blocks)
+            self.blocks.append(block)
+            self.slots.append(slot)
+            self.rooms.append(room)
+        else:
+            self.blocks[i] = block
+            self.slots[i] = slot
+            self.rooms[i] = room
+
+    def copy(self) -> "SchedulingAttempt":
+        """Cheap copy: flat list copies instead of rebuilding a dict of objects"""
+        return SchedulingAttempt(
+            blocks=self.blocks.copy(),
+            rooms=self.rooms.copy(),
+            slots=self.slots.copy(),
+            score=self.score,
+            unassigned_blocks=self.unassigned_blocks.copy(),
+            _index=self._index.copy(),
+        )
+
+    def to_assignments(self) -> Dict[str, Assignment]:
+        """Materialize the legacy block_id -> Assignment map (e.g. for JSON export)"""
+        return {
+            block_id: Assignment(self.blocks[i], self.slots[i], self.rooms[i])
+            for block_id, i in self._index.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.blocks)
@@ -8,7 +8,7 @@ from models.department import Department
 from models.time_preferences import BaseAvailability, Day, TimePreference
 
 
-@dataclass
+@dataclass(slots=True)
 class AcademicDegree:
     id: int
     name: str
@@ -18,7 +18,7 @@ class AcademicDegree:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class StaffMember:
     id: int
     name: str
@@ -39,6 +39,9 @@ class StaffMember:
 
 
 class Lecturer(StaffMember):
+    # Keep slotted layout from StaffMember (no per-instance __dict__)
+    __slots__ = ()
+
     ALLOWED_DEGREES = {
         1,  # استاذ
         2,  # استاذ مساعد
@@ -54,6 +57,8 @@ class Lecturer(StaffMember):
 
 
 class TeachingAssistant(StaffMember):
+    __slots__ = ()
+
     ALLOWED_DEGREES = {
         4,
         5,
@@ -20,7 +20,7 @@ class TAAssignment(TypedDict):
     num_of_groups: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CourseAssignment:
     course_id: int
     course_code: str
@@ -32,7 +32,8 @@ class CourseAssignment:
     preferred_labs: Optional[List[Lab]] = None
     is_common: bool = False
 
-    def __post_init__(self):
+    def validate(self):
+        """Opt-in consistency checks, skipped on bulk loads for speed."""
         # Basic validation
         if self.lecture_groups <= 0:
             raise ValueError("Must have at least one lecture group")
@@ -65,7 +66,7 @@ class CourseAssignment:
                 )
 
 
-@dataclass
+@dataclass(slots=True)
 class StudyPlan:
     name: str
     academic_list: AcademicList
@@ -73,7 +74,8 @@ class StudyPlan:
     expected_students: int
     course_assignments: List[CourseAssignment]
 
-    def __post_init__(self):
+    def validate(self):
+        """Opt-in consistency checks, skipped on bulk loads for speed."""
         if self.academic_level < 1:
             raise ValueError("Academic level must be positive")
         if self.expected_students <= 0:
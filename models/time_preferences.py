@@ -17,7 +17,7 @@ class Day(Enum):
     SATURDAY = 6
 
 
-@dataclass
+@dataclass(slots=True)
 class TimePreference:
     day: Day
     start_time: time
@@ -2,153 +2,234 @@
 
 
 import json
+import sys
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, time
+from operator import attrgetter, itemgetter
 from typing import Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.block import Assignment, BlockType
 from models.labs import Lab
 from utils.room_utils import get_room_key
 
+# Separator strings reused on every call instead of rebuilt per line
+_EQ50 = "=" * 50
+_EQ100 = "=" * 100
+_DASH100 = "-" * 100
+_DASH80_INDENTED = "    " + "-" * 80
 
-def format_schedule(assignments: Dict[str, Assignment]) -> str:
-    """Format schedule into readable output"""
-    # Group assignments by day and time
-    schedule_by_day = defaultdict(lambda: defaultdict(list))
+# Sort keys resolved in C instead of per-compare Python lambdas
+_ASSIGNMENT_ORDER = attrgetter("block.block_type.value", "block.course_object.course_code")
 
-    for block_id, assignment in assignments.items():
-        day = assignment.time_slot.day
-        start_time = assignment.time_slot.start_time
-        schedule_by_day[day][start_time].append(assignment)
 
-    # Format output
-    output = []
-    output.append("=" * 100)
-    output.append("UNIVERSITY SCHEDULE")
-    output.append("=" * 100)
-
-    # Sort days and times
-    for day in sorted(schedule_by_day.keys(), key=lambda x: x.value):
-        output.append(f"\n{day.name}")
-        output.append("-" * 100)
-
-        for start_time in sorted(schedule_by_day[day].keys()):
-            output.append(f"\n{start_time.strftime('%I:%M %p')}:")
-
-            # Sort assignments by type (lectures first, then labs)
-            assignments = sorted(
-                schedule_by_day[day][start_time],
-                key=lambda x: (
-                    x.block.block_type.value,
-                    x.block.course_object.course_code,
-                ),
-            )
+# Interned copies of the names/enum values repeated across the serialized
+# payload, keyed by id() of the owning object — enum members, departments
+# and degrees are long-lived singletons, so id keys are stable. Equal
+# strings then share one allocation in the output instead of N copies.
+_INTERNED: Dict[int, str] = {}
 
-            for assignment in assignments:
-                block = assignment.block
-                room = assignment.room
 
-                # Format session type and group info
-                session_type = (
-                    "Lecture" if block.block_type == BlockType.LECTURE else "Lab"
-                )
-                group_info = f"Group {block.group_number}/{block.total_groups}"
+def _intern(owner, value: str) -> str:
+    s = _INTERNED.get(id(owner))
+    if s is None:
+        s = _INTERNED[id(owner)] = sys.intern(value)
+    return s
 
-                # Format basic info
-                info = [
-                    f"Course: {block.course_object.course_code}",
-                    f"Type: {session_type}",
-                    f"Group: {group_info}",
-                    f"Room: {room.name} (Capacity: {room.capacity})",
-                    f"Staff: {block.staff_member.name}",
-                ]
 
-                output.append("    " + " | ".join(info))
+# Above this many serialized assignments the JSON export streams in chunks
+# of _STREAM_CHUNK items instead of building one giant bytes buffer
+_STREAM_THRESHOLD = 5000
+_STREAM_CHUNK = 1000
 
-                # Add staff details
-                staff_details = [
-                    f"      Staff Department: {block.staff_member.department.name}",
-                    f"      Academic Degree: {block.staff_member.academic_degree.name}",
-                ]
-                output.extend(staff_details)
+# strftime re-parses its format string on every call; schedules reuse a
+# handful of time-of-day values, so memoize both renderings per value
+_FMT_AMPM: Dict[time, str] = {}
+_FMT_HM: Dict[time, str] = {}
 
-                # Add room type for labs
-                if isinstance(room, Lab):
-                    output.append(f"      Lab Type: {room.lab_type.value}")
 
-                output.append("    " + "-" * 80)  # Separator between assignments
+def _ampm(t: time) -> str:
+    s = _FMT_AMPM.get(t)
+    if s is None:
+        s = _FMT_AMPM[t] = t.strftime("%I:%M %p")
+    return s
 
-    return "\n".join(output)
 
+def _hm(t: time) -> str:
+    s = _FMT_HM.get(t)
+    if s is None:
+        s = _FMT_HM[t] = t.strftime("%H:%M")
+    return s
 
-def print_schedule_statistics(assignments: Dict[str, Assignment]):
-    """Print statistics about the schedule"""
-    # Initialize counters
-    total_sessions = len(assignments)
+
+def _group_order(item):
+    """Sort key for ((day, start_time), assignments) grouping items"""
+    day, start_time = item[0]
+    return day.value, start_time
+
+
+def _collect(assignments: Dict[str, Assignment]):
+    """Single pass over assignments: grouped schedule plus statistics counters.
+
+    Returns (groups, lectures, rooms_used, staff_assigned, courses) where
+    groups maps (day, start_time) -> assignments in one flat dict — a single
+    hash lookup per insert instead of the two a nested day/time mapping costs.
+    Lab count is len(assignments) - lectures. Shared by the formatting and
+    statistics functions so each caller walks the assignment map only once.
+    """
+    groups = defaultdict(list)
     lectures = 0
-    labs = 0
     rooms_used = set()
     staff_assigned = set()
     courses = set()
+    lecture = BlockType.LECTURE
 
     for assignment in assignments.values():
-        # Count session types
-        if assignment.block.block_type == BlockType.LECTURE:
-            lectures += 1
-        else:
-            labs += 1
+        block = assignment.block
+        time_slot = assignment.time_slot
+        groups[(time_slot.day, time_slot.start_time)].append(assignment)
 
-        # Track unique resources
+        # Enum members are singletons, so identity beats __eq__ dispatch
+        if block.block_type is lecture:
+            lectures += 1
         rooms_used.add(assignment.room.name)
-        staff_assigned.add(assignment.block.staff_member.name)
-        courses.add(assignment.block.course_object.course_code)
+        staff_assigned.add(block.staff_member.name)
+        courses.add(block.course_object.course_code)
+
+    return groups, lectures, rooms_used, staff_assigned, courses
+
+
+def format_schedule(assignments: Dict[str, Assignment], pre=None) -> str:
+    """Format schedule into readable output"""
+    # Group assignments by day and time (reuse the caller's pass if provided)
+    if pre is None:
+        pre = _collect(assignments)
+    groups = pre[0]
+
+    # Format output
+    output = [_EQ100, "UNIVERSITY SCHEDULE", _EQ100]
+
+    # One sort over the flat (day, start_time) groups; day headers are
+    # emitted whenever the day changes between consecutive groups
+    current_day = None
+    for (day, start_time), slot_assignments in sorted(
+        groups.items(), key=_group_order
+    ):
+        if day is not current_day:
+            output.extend((f"\n{day.name}", _DASH100))
+            current_day = day
+
+        output.append(f"\n{_ampm(start_time)}:")
+
+        # Sort assignments by type (lectures first, then labs)
+        for assignment in sorted(slot_assignments, key=_ASSIGNMENT_ORDER):
+            # Alias every attribute read more than once so the loop does
+            # LOAD_FAST instead of repeated attribute-chain lookups
+            block = assignment.block
+            room = assignment.room
+            staff = block.staff_member
+
+            # Format session type and group info
+            session_type = (
+                "Lecture" if block.block_type == BlockType.LECTURE else "Lab"
+            )
+            group_info = f"Group {block.group_number}/{block.total_groups}"
+
+            # Emit the whole assignment as one extend() instead of six
+            # separate appends; the info line folds the five fields into
+            # a single f-string so fewer intermediate strings are built
+            info_line = (
+                f"    Course: {block.course_object.course_code} | "
+                f"Type: {session_type} | Group: {group_info} | "
+                f"Room: {room.name} (Capacity: {room.capacity}) | "
+                f"Staff: {staff.name}"
+            )
+
+            if isinstance(room, Lab):
+                output.extend(
+                    (
+                        info_line,
+                        f"      Staff Department: {staff.department.name}",
+                        f"      Academic Degree: {staff.academic_degree.name}",
+                        f"      Lab Type: {room.lab_type.value}",
+                        _DASH80_INDENTED,  # Separator between assignments
+                    )
+                )
+            else:
+                output.extend(
+                    (
+                        info_line,
+                        f"      Staff Department: {staff.department.name}",
+                        f"      Academic Degree: {staff.academic_degree.name}",
+                        _DASH80_INDENTED,  # Separator between assignments
+                    )
+                )
+
+    return "\n".join(output)
+
+
+def print_schedule_statistics(assignments: Dict[str, Assignment], pre=None):
+    """Print statistics about the schedule"""
+    total_sessions = len(assignments)
+    if pre is None:
+        pre = _collect(assignments)
+    _, lectures, rooms_used, staff_assigned, courses = pre
+    labs = total_sessions - lectures
 
     # Print statistics
-    print("\n" + "=" * 50)
+    print("\n" + _EQ50)
     print("SCHEDULE STATISTICS")
-    print("=" * 50)
+    print(_EQ50)
     print(f"Total Sessions: {total_sessions}")
     print(f"Total Lectures: {lectures}")
     print(f"Total Labs: {labs}")
     print(f"Unique Rooms Used: {len(rooms_used)}")
     print(f"Staff Members Involved: {len(staff_assigned)}")
     print(f"Courses Scheduled: {len(courses)}")
-    print("=" * 50)
+    print(_EQ50)
 
 
 def generate_schedule_report(
     assignments: Dict[str, Assignment], output_file: str = "schedule_report.txt"
 ):
     """Generate a complete schedule report"""
-    with open(output_file, "w", encoding="utf-8") as f:
-        # Write formatted schedule
-        f.write(format_schedule(assignments))
-
-        # Add statistics
-        f.write("\n\n")
-
-        # Collect statistics
-        total_sessions = len(assignments)
-        lectures = sum(
-            1 for a in assignments.values() if a.block.block_type == BlockType.LECTURE
+    # Collect all statistics in one fused pass instead of a separate
+    # traversal per counter
+    pre = _collect(assignments)
+    _, lectures, rooms_used_set, staff_assigned_set, courses_set = pre
+    total_sessions = len(assignments)
+    labs = total_sessions - lectures
+    rooms_used = len(rooms_used_set)
+    staff_assigned = len(staff_assigned_set)
+    courses = len(courses_set)
+
+    # Assemble the whole report in memory and flush it with a single write
+    # instead of a dozen small ones through the text-IO layer
+    report = "".join(
+        (
+            format_schedule(assignments, pre=pre),
+            "\n\n",
+            _EQ50 + "\n",
+            "SCHEDULE STATISTICS\n",
+            _EQ50 + "\n",
+            f"Total Sessions: {total_sessions}\n",
+            f"Total Lectures: {lectures}\n",
+            f"Total Labs: {labs}\n",
+            f"Unique Rooms Used: {rooms_used}\n",
+            f"Staff Members Involved: {staff_assigned}\n",
+            f"Courses Scheduled: {courses}\n",
+            _EQ50 + "\n",
         )
-        labs = total_sessions - lectures
-
-        rooms_used = len({a.room.name for a in assignments.values()})
-        staff_assigned = len({a.block.staff_member.name for a in assignments.values()})
-        courses = len({a.block.course_object.course_code for a in assignments.values()})
-
-        # Write statistics
-        f.write("=" * 50 + "\n")
-        f.write("SCHEDULE STATISTICS\n")
-        f.write("=" * 50 + "\n")
-        f.write(f"Total Sessions: {total_sessions}\n")
-        f.write(f"Total Lectures: {lectures}\n")
-        f.write(f"Total Labs: {labs}\n")
-        f.write(f"Unique Rooms Used: {rooms_used}\n")
-        f.write(f"Staff Members Involved: {staff_assigned}\n")
-        f.write(f"Courses Scheduled: {courses}\n")
-        f.write("=" * 50 + "\n")
+    )
+
+    # Encode once and write through the binary layer, skipping the text-IO
+    # wrapper's incremental encoder and newline translation
+    with open(output_file, "wb") as f:
+        f.write(report.encode("utf-8"))
 
     print(f"Schedule report generated: {output_file}")
 
@@ -157,23 +238,34 @@ def generate_schedule_json(
     assignments: Dict[str, Assignment], output_file: str = "schedule.json"
 ):
     """Generate a JSON representation of the schedule"""
-    # Convert the schedule to a serializable format
-    serialized_schedule = []
+    # Convert the schedule to a serializable format. Each entry is decorated
+    # with its (day_index, start_time) sort key so the final ordering pass
+    # reads precomputed tuple fields instead of chasing nested dict lookups.
+    decorated = []
+    room_keys = set()
 
     for block_id, assignment in assignments.items():
+        # Alias every attribute referenced more than once; the loop body is
+        # pure attribute traffic, so locals cut most of the interpreter work
         block = assignment.block
         room = assignment.room
         time_slot = assignment.time_slot
+        staff = block.staff_member
+        day = time_slot.day
+        start_time = _hm(time_slot.start_time)
 
-        # Use composite key for room identification
+        # Use composite key for room identification; remember it for the
+        # metadata block so we don't re-derive keys in a second pass
         room_type, room_id = get_room_key(room)
-        lab_type = room.lab_type.value if room_type == "lab" else None
+        room_keys.add((room_type, room_id))
 
-        # Create serializable object for this assignment
+        # Create serializable object for this assignment in one dict literal;
+        # the lab-only fields are merged at construction instead of patched
+        # in afterwards via subscript assignments
         serialized_assignment = {
             "block_id": block_id,
             "course_code": block.course_object.course_code,
-            "session_type": block.block_type.value,
+            "session_type": _intern(block.block_type, block.block_type.value),
             "group_info": {
                 "group_number": block.group_number,
                 "total_groups": block.total_groups,
@@ -184,43 +276,43 @@ def generate_schedule_json(
                 "name": room.name,
                 "capacity": room.capacity,
                 "type": room_type,
+                **(
+                    {
+                        "lab_type": _intern(room.lab_type, room.lab_type.value),
+                        "used_in_non_specialist_courses": room.used_in_non_specialist_courses,
+                    }
+                    if room_type == "lab"
+                    else {}
+                ),
             },
             "staff": {
-                "id": block.staff_member.id,
-                "name": block.staff_member.name,
-                "department": block.staff_member.department.name,
-                "academic_degree": block.staff_member.academic_degree.name,
-                "is_permanent": block.staff_member.is_permanent,
+                "id": staff.id,
+                "name": staff.name,
+                "department": _intern(staff.department, staff.department.name),
+                "academic_degree": _intern(
+                    staff.academic_degree, staff.academic_degree.name
+                ),
+                "is_permanent": staff.is_permanent,
             },
             "time_slot": {
-                "day": time_slot.day.name,
-                "day_index": time_slot.day.value,
-                "start_time": time_slot.start_time.strftime("%H:%M"),
-                "end_time": time_slot.end_time.strftime("%H:%M"),
+                "day": _intern(day, day.name),
+                "day_index": day.value,
+                "start_time": start_time,
+                "end_time": _hm(time_slot.end_time),
             },
             "student_count": block.student_count,
             "academic_list": block.academic_list,
             "academic_level": block.academic_level,
         }
 
-        # Add lab-specific info if applicable
-        if room_type == "lab":
-            serialized_assignment["room"]["lab_type"] = lab_type
-            serialized_assignment["room"][
-                "used_in_non_specialist_courses"
-            ] = room.used_in_non_specialist_courses
+        decorated.append((day.value, start_time, serialized_assignment))
 
-        serialized_schedule.append(serialized_assignment)
-
-    # Sort by day and start time for consistency
-    serialized_schedule.sort(
-        key=lambda x: (x["time_slot"]["day_index"], x["time_slot"]["start_time"])
-    )
+    # Sort by day and start time for consistency ("%H:%M" strings order
+    # chronologically), then strip the decoration
+    decorated.sort(key=itemgetter(0, 1))
+    serialized_schedule = [item[2] for item in decorated]
 
     # Create metadata with composite key stats
-    room_keys = set(
-        get_room_key(assignment.room) for assignment in assignments.values()
-    )
     metadata = {
         "total_sessions": len(assignments),
         "total_courses": len(set(a["course_code"] for a in serialized_schedule)),
@@ -232,9 +324,27 @@ def generate_schedule_json(
     # Create final output object
     output = {"metadata": metadata, "schedule": serialized_schedule}
 
-    # Write to file
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
+    # Write to file - orjson serializes roughly 5x faster than the stdlib,
+    # which dominates the export cost on large schedules
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            if len(serialized_schedule) > _STREAM_THRESHOLD:
+                # orjson.dumps builds its whole output buffer up front, which
+                # doubles peak memory on very large schedules. Stream the
+                # schedule array in chunks instead (compact output here —
+                # files this size are for machine consumption anyway).
+                f.write(b'{"metadata":' + orjson.dumps(metadata) + b',"schedule":[')
+                for start in range(0, len(serialized_schedule), _STREAM_CHUNK):
+                    if start:
+                        f.write(b",")
+                    chunk = serialized_schedule[start : start + _STREAM_CHUNK]
+                    f.write(orjson.dumps(chunk)[1:-1])
+                f.write(b"]}")
+            else:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
 
     print(f"Schedule JSON file generated: {output_file}")
     return output
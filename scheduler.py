@@ -1,10 +1,17 @@
 # scheduler.py - Enhanced with comprehensive logging
 
 import logging
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from math import exp
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, time
 from enum import Enum
+from itertools import groupby
+from operator import itemgetter
 from typing import Callable, Dict, List, Optional, Set, Union
 
 from models.block import Assignment, Block, BlockType
@@ -22,11 +29,79 @@ from schedule_format import (
 from utils.room_utils import get_room_key
 
 
+def _run_single_attempt(constraint_manager, resource_manager, blocks, seed):
+    """Run one scheduling attempt in a worker process.
+
+    Each worker receives its own pickled copies of the managers, so attempts
+    are fully independent; the seed drives tie-break shuffling in the
+    priority sort so different workers explore different orderings.
+    """
+    engine = SchedulingEngine(constraint_manager, resource_manager)
+    return engine._run_attempt(blocks, attempt_number=seed + 1, rng=random.Random(seed))
+
+
 class SchedulingEngine:
+    # Stop attempting after this many consecutive attempts without a new
+    # best — in practice runs plateau long before max_attempts is reached
+    _ATTEMPT_PATIENCE = 15
+
     def __init__(self, constraint_manager, resource_manager):
         self.constraint_manager = constraint_manager
         self.resource_manager = resource_manager
         self.logger = logging.getLogger("scheduler")
+        # Suitable rooms per block id. The result depends only on the
+        # block's room type, preferred rooms and student count — none of
+        # which change during scheduling — so it is computed once per block
+        # instead of on every sort/score/schedule call across attempts.
+        self._suitable_rooms_cache: Dict[str, tuple] = {}
+        # Static priority score per block id — its inputs are immutable per
+        # block, so it never needs recomputing across sorts or attempts
+        self._priority_cache: Dict[str, float] = {}
+        # Bit assigned per distinct room/staff, so occupancy within a time
+        # bucket packs into one int and conflict detection is a mask test
+        self._room_bits: Dict[tuple, int] = {}
+        self._staff_bits: Dict[int, int] = {}
+        # Booking-independent (room, slots) domain per block id — room
+        # availability intersected with staff preferences, computed once;
+        # bookings are filtered out at search time via the occupancy dicts
+        self._domain_cache: Dict[str, list] = {}
+        # One-slot cache of the last (blocks list, scored ordering) pair —
+        # scores against fresh state are identical across attempts
+        self._order_cache = None
+
+    def _get_domain(self, block: Block) -> list:
+        """Forward-checked search domain for a block.
+
+        Each entry is (room, candidate_slots) with rooms already filtered
+        for type/capacity and slots reduced to the room-availability /
+        staff-preference intersection. None of that depends on current
+        bookings, so it is computed once per block instead of per visit;
+        rooms whose domain is empty are pruned outright.
+        """
+        domain = self._domain_cache.get(block.id)
+        if domain is None:
+            domain = []
+            for room in self._get_suitable_rooms_cached(block):
+                slots = self.resource_manager.get_available_slots(block, room, {})
+                if slots:
+                    domain.append((room, slots))
+            self._domain_cache[block.id] = domain
+        return domain
+
+    @staticmethod
+    def _bit_for(table: dict, key) -> int:
+        bit = table.get(key)
+        if bit is None:
+            bit = table[key] = 1 << len(table)
+        return bit
+
+    def _get_suitable_rooms_cached(self, block: Block) -> tuple:
+        rooms = self._suitable_rooms_cache.get(block.id)
+        if rooms is None:
+            rooms = self._suitable_rooms_cache[block.id] = tuple(
+                self.resource_manager.get_suitable_rooms(block)
+            )
+        return rooms
 
     def schedule_blocks(
         self,
@@ -44,7 +119,7 @@ class SchedulingEngine:
         )
         total_blocks = len(blocks)
 
-        self.logger.info(f"Converted to {total_blocks} blocks total")
+        self.logger.info("Converted to %d blocks total", total_blocks)
 
         best_assignments = {}
         best_score = 0.0
@@ -53,231 +128,387 @@ class SchedulingEngine:
         if progress_callback:
             progress_callback(0, total_blocks, "initializing", 1)
 
-        for attempt in range(max_attempts):
-            self.logger.info(
-                f"\n=== SCHEDULING ATTEMPT {attempt + 1}/{max_attempts} ==="
+        if progress_callback is None and max_attempts > 1:
+            # Attempts are independent restarts, so without a progress
+            # callback to report through they can run in worker processes
+            # (the callback cannot cross the process boundary)
+            best_assignments, best_count, best_score = self._run_attempts_parallel(
+                blocks, max_attempts
             )
-
-            # CRITICAL: Fresh state for each attempt
-            self.constraint_manager.initialize_fresh_state()
-            scheduled_count = 0
-
-            # Sort blocks by priority (uses current empty state)
-            sorted_blocks = self._sort_blocks_by_priority(blocks)
-
-            # Schedule each block one by one
-            for i, block in enumerate(sorted_blocks):
-                self.logger.info(
-                    f"\n--- Scheduling block {i+1}/{len(sorted_blocks)}: {block.id} ---"
+        else:
+            attempts_since_improvement = 0
+            for attempt in range(max_attempts):
+                self.logger.debug(
+                    "\n=== SCHEDULING ATTEMPT %d/%d ===", attempt + 1, max_attempts
                 )
 
-                assignment = self._schedule_single_block(block)
-
-                if assignment:
-                    # ATOMIC OPERATION: Check and commit in one step
-                    success = self.constraint_manager.make_assignment(
-                        block.id, assignment
+                current_assignments, scheduled_count, attempt_score = (
+                    self._run_attempt(
+                        blocks,
+                        attempt_number=attempt + 1,
+                        progress_callback=progress_callback,
                     )
-                    if success:
-                        scheduled_count += 1
-                        self.logger.info(
-                            f"SUCCESS: {block.id} scheduled ({scheduled_count}/{total_blocks})"
-                        )
+                )
 
-                        if progress_callback:
-                            progress_callback(
-                                scheduled_count, total_blocks, "scheduling", attempt + 1
-                            )
-                    else:
-                        self.logger.error(f"FAILED to commit assignment for {block.id}")
+                self.logger.debug("\n=== ATTEMPT %d RESULTS ===", attempt + 1)
+                self.logger.debug("Scheduled: %d/%d", scheduled_count, total_blocks)
+                self.logger.debug("Score: %.3f", attempt_score)
+
+                # Update best if this is better
+                if scheduled_count > best_count or (
+                    scheduled_count == best_count and attempt_score > best_score
+                ):
+                    best_assignments = current_assignments.copy()
+                    best_score = attempt_score
+                    best_count = scheduled_count
+                    attempts_since_improvement = 0
+                    self.logger.info("NEW BEST ATTEMPT!")
                 else:
-                    self.logger.warning(f"FAILED to find assignment for {block.id}")
-
-            # Evaluate this attempt
-            current_assignments = self.constraint_manager.get_all_assignments()
-            attempt_score = self._evaluate_schedule(current_assignments)
-
-            self.logger.info(f"\n=== ATTEMPT {attempt + 1} RESULTS ===")
-            self.logger.info(f"Scheduled: {scheduled_count}/{total_blocks}")
-            self.logger.info(f"Score: {attempt_score:.3f}")
-
-            # Update best if this is better
-            if scheduled_count > best_count or (
-                scheduled_count == best_count and attempt_score > best_score
-            ):
-                best_assignments = current_assignments.copy()
-                best_score = attempt_score
-                best_count = scheduled_count
-                self.logger.info("NEW BEST ATTEMPT!")
-
-            # Perfect schedule check
-            if scheduled_count == total_blocks and attempt_score >= 0.95:
-                self.logger.info("PERFECT SCHEDULE ACHIEVED!")
-                if progress_callback:
-                    progress_callback(
-                        scheduled_count, total_blocks, "completed", attempt + 1
+                    attempts_since_improvement += 1
+
+                # Perfect schedule check
+                if scheduled_count == total_blocks and attempt_score >= 0.95:
+                    self.logger.info("PERFECT SCHEDULE ACHIEVED!")
+                    if progress_callback:
+                        progress_callback(
+                            scheduled_count, total_blocks, "completed", attempt + 1
+                        )
+                    break
+
+                # Plateau check: further identical restarts rarely improve
+                if attempts_since_improvement >= self._ATTEMPT_PATIENCE:
+                    self.logger.info(
+                        "No improvement in %d attempts - stopping early",
+                        attempts_since_improvement,
                     )
-                break
+                    break
 
         if not best_assignments:
             self.logger.error("SCHEDULING FAILED: Could not find any valid schedule")
             raise ValueError("Could not find a valid schedule")
 
-        self.logger.info(f"\n=== FINAL RESULT ===")
-        self.logger.info(f"Best schedule: {best_count}/{total_blocks} blocks")
-        self.logger.info(f"Success rate: {(best_count/total_blocks)*100:.1f}%")
+        self.logger.info("\n=== FINAL RESULT ===")
+        self.logger.info("Best schedule: %d/%d blocks", best_count, total_blocks)
+        self.logger.info("Success rate: %.1f%%", (best_count / total_blocks) * 100)
 
         # FINAL VERIFICATION
         self._verify_final_schedule(best_assignments)
 
         return best_assignments
 
-    def _schedule_single_block(self, block: Block) -> Optional[Assignment]:
-        possible_rooms = self.resource_manager.get_suitable_rooms(block)
-        for room in possible_rooms:
-            available_slots = self.resource_manager.get_available_slots(
-                block, room, self.constraint_manager.get_all_assignments()
+    def _run_attempt(
+        self,
+        blocks: List[Block],
+        attempt_number: int,
+        progress_callback: Optional[Callable] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """Run one scheduling attempt from a fresh state.
+
+        Returns (assignments, scheduled_count, score) for the attempt.
+        """
+        # CRITICAL: Fresh state for each attempt
+        self.constraint_manager.initialize_fresh_state()
+        scheduled_count = 0
+        total_blocks = len(blocks)
+
+        # Sort blocks by priority (uses current empty state)
+        sorted_blocks = self._sort_blocks_by_priority(blocks, rng=rng)
+
+        # Schedule each block one by one
+        for i, block in enumerate(sorted_blocks):
+            self.logger.debug(
+                "\n--- Scheduling block %d/%d: %s ---", i + 1, len(sorted_blocks), block.id
             )
-            for slot in available_slots:
+
+            assignment = self._schedule_single_block(block)
+
+            if assignment:
+                # ATOMIC OPERATION: Check and commit in one step
+                success = self.constraint_manager.make_assignment(block.id, assignment)
+                if success:
+                    scheduled_count += 1
+                    self.logger.debug(
+                        "SUCCESS: %s scheduled (%d/%d)",
+                        block.id,
+                        scheduled_count,
+                        total_blocks,
+                    )
+
+                    if progress_callback:
+                        progress_callback(
+                            scheduled_count, total_blocks, "scheduling", attempt_number
+                        )
+                else:
+                    self.logger.error("FAILED to commit assignment for %s", block.id)
+            else:
+                self.logger.warning("FAILED to find assignment for %s", block.id)
+
+        # Evaluate this attempt
+        current_assignments = self.constraint_manager.get_all_assignments()
+        attempt_score = self._evaluate_schedule(current_assignments)
+
+        return current_assignments, scheduled_count, attempt_score
+
+    def _run_attempts_parallel(self, blocks: List[Block], max_attempts: int):
+        """Run the scheduling attempts across worker processes.
+
+        Each attempt is an independent restart, so the constraint-check-heavy
+        work parallelizes across cores; results are reduced in submission
+        order so ties between equally good attempts resolve deterministically.
+        Returns (best_assignments, best_count, best_score).
+        """
+        total_blocks = len(blocks)
+        best_assignments = {}
+        best_score = 0.0
+        best_count = 0
+
+        max_workers = min(os.cpu_count() or 1, max_attempts)
+        self.logger.info(
+            "Running %d attempts on %d worker processes", max_attempts, max_workers
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_single_attempt,
+                    self.constraint_manager,
+                    self.resource_manager,
+                    blocks,
+                    seed,
+                )
+                for seed in range(max_attempts)
+            ]
+
+            attempts_since_improvement = 0
+            for attempt, future in enumerate(futures):
+                current_assignments, scheduled_count, attempt_score = future.result()
+
+                self.logger.debug("\n=== ATTEMPT %d RESULTS ===", attempt + 1)
+                self.logger.debug("Scheduled: %d/%d", scheduled_count, total_blocks)
+                self.logger.debug("Score: %.3f", attempt_score)
+
+                if scheduled_count > best_count or (
+                    scheduled_count == best_count and attempt_score > best_score
+                ):
+                    best_assignments = current_assignments
+                    best_score = attempt_score
+                    best_count = scheduled_count
+                    attempts_since_improvement = 0
+                    self.logger.info("NEW BEST ATTEMPT!")
+                else:
+                    attempts_since_improvement += 1
+
+                if scheduled_count == total_blocks and attempt_score >= 0.95:
+                    self.logger.info("PERFECT SCHEDULE ACHIEVED!")
+                    for pending in futures[attempt + 1 :]:
+                        pending.cancel()
+                    break
+
+                if attempts_since_improvement >= self._ATTEMPT_PATIENCE:
+                    self.logger.info(
+                        "No improvement in %d attempts - stopping early",
+                        attempts_since_improvement,
+                    )
+                    for pending in futures[attempt + 1 :]:
+                        pending.cancel()
+                    break
+
+        return best_assignments, best_count, best_score
+
+    def _schedule_single_block(self, block: Block) -> Optional[Assignment]:
+        # Iterate the precomputed static domain; get_available_slots used
+        # to rescan every existing assignment per candidate room, but the
+        # booking-dependent part is exactly what the occupancy fast path
+        # below answers with two dict probes per slot: slots that
+        # can_assign would reject on its first two constraints anyway are
+        # skipped without the full constraint-chain dispatch
+        state = self.constraint_manager.state
+        staff_booked = state.staff_bookings.get(block.staff_member.id, {})
+        for room, candidate_slots in self._get_domain(block):
+            room_booked = state.room_bookings.get(get_room_key(room), {})
+            for slot in candidate_slots:
+                slot_key = (slot.day, slot.start_time)
+                if slot_key in room_booked or slot_key in staff_booked:
+                    continue
                 is_valid, _ = self.constraint_manager.can_assign(block, slot, room)
                 if is_valid:
                     return Assignment(block, slot, room)
         return None
 
-    def _verify_no_conflicts_in_assignments(self, assignments):
-        # Group by time slot
+    def _group_assignments_by_time(self, assignments):
+        """Bucket assignments by (day, start_time) for conflict scanning.
+
+        When verifying the constraint manager's own live state this reuses
+        its incrementally maintained index; arbitrary mappings (e.g. a
+        saved best attempt) are bucketed with a single scan.
+        """
+        if assignments is self.constraint_manager.current_assignments:
+            return self.constraint_manager.time_index
+
         by_time = {}
         for block_id, assignment in assignments.items():
             key = (assignment.time_slot.day, assignment.time_slot.start_time)
             if key not in by_time:
                 by_time[key] = []
             by_time[key].append((block_id, assignment))
+        return by_time
+
+    def _check_time_conflicts(self, by_time, fail_fast: bool = False) -> bool:
+        """Scan bucketed assignments for room/staff double-bookings.
 
-        # Check each time slot
-        for time_key, time_assignments in by_time.items():
-            rooms_used = set()
-            staff_used = set()
+        Returns True when no conflicts exist. With fail_fast the scan stops
+        at the first conflict; otherwise every conflict is logged.
+        """
+        conflicts_found = False
+        room_bit = self._room_bits
+        staff_bit = self._staff_bits
+        bit_for = self._bit_for
+
+        for time_key, slot_assignments in by_time.items():
+            if len(slot_assignments) <= 1:
+                continue
+
+            # Fast path: pack the bucket's occupancy into two ints — a
+            # conflict shows up as a repeated bit. Only buckets that
+            # actually conflict pay for the detailed scan below, which
+            # exists to produce the per-conflict log messages.
+            room_mask = 0
+            staff_mask = 0
+            clean = True
+            for _, assignment in slot_assignments:
+                rb = bit_for(room_bit, get_room_key(assignment.room))
+                sb = bit_for(staff_bit, assignment.block.staff_member.id)
+                if room_mask & rb or staff_mask & sb:
+                    clean = False
+                    break
+                room_mask |= rb
+                staff_mask |= sb
+            if clean:
+                continue
+
+            if not fail_fast:
+                day, start_time = time_key
+                self.logger.debug(
+                    "Checking time slot: %s %s (%d assignments)",
+                    day.name,
+                    start_time,
+                    len(slot_assignments),
+                )
 
-            for block_id, assignment in time_assignments:
+            rooms_used = {}
+            staff_used = {}
+
+            for block_id, assignment in slot_assignments:
                 room_key = get_room_key(assignment.room)
                 staff_id = assignment.block.staff_member.id
 
+                # Room conflict check
                 if room_key in rooms_used:
+                    if fail_fast:
+                        self.logger.error(
+                            "VERIFICATION FAILED: Room %s double-booked at %s",
+                            room_key,
+                            time_key,
+                        )
+                        return False
+                    conflicts_found = True
                     self.logger.error(
-                        f"VERIFICATION FAILED: Room {room_key} double-booked at {time_key}"
+                        "ROOM CONFLICT: %s used by both %s and %s",
+                        assignment.room.name,
+                        rooms_used[room_key],
+                        block_id,
                     )
-                    return False
+                else:
+                    rooms_used[room_key] = block_id
 
+                # Staff conflict check
                 if staff_id in staff_used:
+                    if fail_fast:
+                        self.logger.error(
+                            "VERIFICATION FAILED: Staff %s double-booked at %s",
+                            staff_id,
+                            time_key,
+                        )
+                        return False
+                    conflicts_found = True
                     self.logger.error(
-                        f"VERIFICATION FAILED: Staff {staff_id} double-booked at {time_key}"
+                        "STAFF CONFLICT: %s assigned to both %s and %s",
+                        assignment.block.staff_member.name,
+                        staff_used[staff_id],
+                        block_id,
                     )
-                    return False
-
-                rooms_used.add(room_key)
-                staff_used.add(staff_id)
-
-        return True
+                else:
+                    staff_used[staff_id] = block_id
 
-    def _sort_blocks_by_priority(self, blocks: List[Block]) -> List[Block]:
-        """Sort blocks by various constraints and priorities"""
-        self.logger.debug("Sorting blocks by priority...")
+        return not conflicts_found
 
-        def get_block_score(block: Block) -> tuple:
-            # Get current state for accurate calculations
-            current_assignments = self.constraint_manager.get_all_assignments()
+    def _verify_no_conflicts_in_assignments(self, assignments):
+        return self._check_time_conflicts(
+            self._group_assignments_by_time(assignments), fail_fast=True
+        )
 
-            # Get possible rooms for this block
-            possible_rooms = self.resource_manager.get_suitable_rooms(block)
+    def _sort_blocks_by_priority(
+        self, blocks: List[Block], rng: Optional[random.Random] = None
+    ) -> List[Block]:
+        """Sort blocks by various constraints and priorities.
 
-            # Calculate total available time slots across all possible rooms
-            total_available_slots = 0
-            for room in possible_rooms:
-                available_slots = self.resource_manager.get_available_slots(
-                    block, room, current_assignments
-                )
-                total_available_slots += len(available_slots)
-
-            # Calculate priority score
-            priority_score = self._calculate_block_priority(block)
-
-            return (
-                # First priority: Single group courses
-                block.is_single_group_course,
-                # Second priority: Fewer room options means more constrained
-                -len(possible_rooms),
-                # Third priority: Fewer time slot options means more constrained
-                -total_available_slots,
-                # Fourth priority: Calculated priority score
-                priority_score,
-            )
+        Every attempt sorts right after initialize_fresh_state, so for a
+        given block list the scores are computed against the same empty
+        state each time — the scored ordering is cached per list and only
+        the tie-break shuffle differs between attempts.
+        """
+        self.logger.debug("Sorting blocks by priority...")
 
-        sorted_blocks = sorted(blocks, key=get_block_score, reverse=True)
+        cached = self._order_cache
+        if cached is not None and cached[0] is blocks:
+            scored = cached[1]
+        else:
+            # Score every block exactly once, then sort the decorated list —
+            # the debug log below reuses the tuples instead of rescoring the
+            # head of the list. The assignments view is snapshotted once for
+            # the whole pass instead of copied per scored block.
+            current_assignments = self.constraint_manager.assignments_view
+            scored = [
+                (self.get_block_score(block, current_assignments), block)
+                for block in blocks
+            ]
+            scored.sort(key=itemgetter(0), reverse=True)
+            self._order_cache = (blocks, scored)
 
         self.logger.debug("Block priority order:")
-        for i, block in enumerate(sorted_blocks[:5]):  # Log first 5
-            score = get_block_score(block)
-            self.logger.debug(f"  {i+1}. {block.id} - Score: {score}")
-
-        return sorted_blocks
+        for i, (score, block) in enumerate(scored[:5]):  # Log first 5
+            self.logger.debug("  %d. %s - Score: %s", i + 1, block.id, score)
+
+        if rng is not None:
+            # Reshuffle only within groups of equal score — the ordering
+            # between groups is fixed, the seed just varies how ties break,
+            # which is what gives the multi-start attempts their diversity
+            result = []
+            for _, group in groupby(scored, key=itemgetter(0)):
+                tie_group = [block for _, block in group]
+                rng.shuffle(tie_group)
+                result.extend(tie_group)
+            return result
+
+        return [block for _, block in scored]
 
     def _verify_final_schedule(self, assignments: Dict[str, Assignment]):
         """Verify the final schedule has no conflicts"""
         self.logger.info("=== FINAL SCHEDULE VERIFICATION ===")
 
-        conflicts_found = False
-
-        # Group assignments by time slot
-        time_slots = {}
-        for block_id, assignment in assignments.items():
-            time_key = (assignment.time_slot.day, assignment.time_slot.start_time)
-            if time_key not in time_slots:
-                time_slots[time_key] = []
-            time_slots[time_key].append((block_id, assignment))
-
-        # Check each time slot for conflicts
-        for time_key, slot_assignments in time_slots.items():
-            day, start_time = time_key
-
-            if len(slot_assignments) > 1:
-                self.logger.debug(
-                    f"Checking time slot: {day.name} {start_time} ({len(slot_assignments)} assignments)"
-                )
-
-                # Check for room conflicts
-                rooms_used = {}
-                staff_used = {}
-
-                for block_id, assignment in slot_assignments:
-                    room_key = get_room_key(assignment.room)
-                    staff_id = assignment.block.staff_member.id
-
-                    # Room conflict check
-                    if room_key in rooms_used:
-                        conflicts_found = True
-                        self.logger.error(
-                            f"ROOM CONFLICT: {assignment.room.name} used by both {rooms_used[room_key]} and {block_id}"
-                        )
-                    else:
-                        rooms_used[room_key] = block_id
-
-                    # Staff conflict check
-                    if staff_id in staff_used:
-                        conflicts_found = True
-                        self.logger.error(
-                            f"STAFF CONFLICT: {assignment.block.staff_member.name} assigned to both {staff_used[staff_id]} and {block_id}"
-                        )
-                    else:
-                        staff_used[staff_id] = block_id
+        no_conflicts = self._check_time_conflicts(
+            self._group_assignments_by_time(assignments)
+        )
 
-        if conflicts_found:
-            self.logger.error("CRITICAL: Final schedule contains conflicts!")
-        else:
+        if no_conflicts:
             self.logger.info(
                 "SUCCESS: Final schedule verification passed - no conflicts found"
             )
+        else:
+            self.logger.error("CRITICAL: Final schedule contains conflicts!")
 
-        return not conflicts_found
+        return no_conflicts
 
     def _convert_course_assignments_to_blocks(
         self,
@@ -286,24 +517,33 @@ class SchedulingEngine:
     ) -> List[Block]:
         """Convert CourseAssignment objects to Block objects"""
         self.logger.info("=== CONVERTING COURSE ASSIGNMENTS TO BLOCKS ===")
-        self.logger.info(f"Course Assignments Count: {len(course_assignments)}")
+        self.logger.info("Course Assignments Count: %d", len(course_assignments))
 
         blocks = []
+        # Maintained during the build loop so the summary does not refilter
+        # the full block list per type afterwards
+        lecture_blocks = []
+        lab_blocks = []
 
         for i, course in enumerate(course_assignments):
             # Get the correct study plan for this course
             study_plan = study_plan_mapping[i]
 
-            self.logger.info(f"\n--- COURSE {i+1}: {course.course_code} ---")
-            self.logger.info(
-                f"Study Plan: {study_plan.academic_list.name} Level {study_plan.academic_level}"
-            )
-            self.logger.info(f"Expected Students: {study_plan.expected_students}")
-            self.logger.info(f"Lecture Groups: {course.lecture_groups}")
-            self.logger.info(f"Lab Groups: {course.lab_groups}")
+            # Multi-line INFO burst: build the strings only when INFO is on
+            info_enabled = self.logger.isEnabledFor(logging.INFO)
+            if info_enabled:
+                self.logger.info(f"\n--- COURSE {i+1}: {course.course_code} ---")
+                self.logger.info(
+                    f"Study Plan: {study_plan.academic_list.name} Level {study_plan.academic_level}"
+                )
+                self.logger.info(f"Expected Students: {study_plan.expected_students}")
+                self.logger.info(f"Lecture Groups: {course.lecture_groups}")
+                self.logger.info(f"Lab Groups: {course.lab_groups}")
 
-            # Generate lecture blocks
-            self.logger.info(f"\n  GENERATING LECTURE BLOCKS for {course.course_code}:")
+                # Generate lecture blocks
+                self.logger.info(
+                    f"\n  GENERATING LECTURE BLOCKS for {course.course_code}:"
+                )
             lecture_group_count = 1
             lecture_blocks_created = 0
 
@@ -311,7 +551,8 @@ class SchedulingEngine:
                 try:
                     if "lecturer" not in lecturer_assignment:
                         self.logger.error(
-                            f"    ERROR: No 'lecturer' key in assignment: {lecturer_assignment}"
+                            "    ERROR: No 'lecturer' key in assignment: %s",
+                            lecturer_assignment,
                         )
                         continue
 
@@ -319,7 +560,7 @@ class SchedulingEngine:
                     num_groups = lecturer_assignment["num_of_groups"]
 
                     self.logger.info(
-                        f"    Creating {num_groups} lecture blocks for {lecturer.name}"
+                        "    Creating %d lecture blocks for %s", num_groups, lecturer.name
                     )
 
                     for group_idx in range(num_groups):
@@ -343,31 +584,35 @@ class SchedulingEngine:
                         )
 
                         blocks.append(lecture_block)
+                        lecture_blocks.append(lecture_block)
                         lecture_blocks_created += 1
 
-                        self.logger.info(f"    CREATED LECTURE BLOCK: {block_id}")
-                        self.logger.info(
-                            f"      Study Plan: {study_plan.academic_list.name} L{study_plan.academic_level}"
-                        )
-                        self.logger.info(f"      Staff: {lecturer.name}")
-                        self.logger.info(
-                            f"      Students: {lecture_block.student_count}"
-                        )
+                        if info_enabled:
+                            self.logger.info(f"    CREATED LECTURE BLOCK: {block_id}")
+                            self.logger.info(
+                                f"      Study Plan: {study_plan.academic_list.name} L{study_plan.academic_level}"
+                            )
+                            self.logger.info(f"      Staff: {lecturer.name}")
+                            self.logger.info(
+                                f"      Students: {lecture_block.student_count}"
+                            )
 
                         lecture_group_count += 1
 
                 except Exception as e:
                     self.logger.error(
-                        f"    ERROR creating lecture block: {str(e)}", exc_info=True
+                        "    ERROR creating lecture block: %s", str(e), exc_info=True
                     )
 
             # Generate lab blocks if they exist
             if course.lab_groups and course.lab_groups > 0:
-                self.logger.info(f"\n  GENERATING LAB BLOCKS for {course.course_code}:")
+                self.logger.info("\n  GENERATING LAB BLOCKS for %s:", course.course_code)
 
                 if not course.teaching_assistants:
                     self.logger.error(
-                        f"    ERROR: Course {course.course_code} has {course.lab_groups} lab groups but no teaching assistants!"
+                        "    ERROR: Course %s has %d lab groups but no teaching assistants!",
+                        course.course_code,
+                        course.lab_groups,
                     )
                     continue
 
@@ -381,7 +626,7 @@ class SchedulingEngine:
                             ta = ta_assignment["teaching_assistant"]
                         elif "teaching_assistant_id" in ta_assignment:
                             self.logger.error(
-                                f"      Cannot create lab block without TA object!"
+                                "      Cannot create lab block without TA object!"
                             )
                             continue
 
@@ -417,47 +662,52 @@ class SchedulingEngine:
                             )
 
                             blocks.append(lab_block)
+                            lab_blocks.append(lab_block)
                             lab_blocks_created += 1
 
-                            self.logger.info(f"      CREATED LAB BLOCK: {block_id}")
-                            self.logger.info(
-                                f"        Study Plan: {study_plan.academic_list.name} L{study_plan.academic_level}"
-                            )
-                            self.logger.info(f"        Staff: {ta.name}")
+                            if info_enabled:
+                                self.logger.info(
+                                    f"      CREATED LAB BLOCK: {block_id}"
+                                )
+                                self.logger.info(
+                                    f"        Study Plan: {study_plan.academic_list.name} L{study_plan.academic_level}"
+                                )
+                                self.logger.info(f"        Staff: {ta.name}")
 
                             lab_group_count += 1
 
                     except Exception as e:
                         self.logger.error(
-                            f"      ERROR creating lab block: {str(e)}", exc_info=True
+                            "      ERROR creating lab block: %s", str(e), exc_info=True
                         )
 
         # Final summary
-        lecture_blocks = [b for b in blocks if b.block_type == BlockType.LECTURE]
-        lab_blocks = [b for b in blocks if b.block_type == BlockType.LAB]
-
-        self.logger.info(f"\n=== BLOCK GENERATION SUMMARY ===")
-        self.logger.info(f"Total Blocks Created: {len(blocks)}")
-        self.logger.info(f"Lecture Blocks: {len(lecture_blocks)}")
-        self.logger.info(f"Lab Blocks: {len(lab_blocks)}")
+        self.logger.info("\n=== BLOCK GENERATION SUMMARY ===")
+        self.logger.info("Total Blocks Created: %d", len(blocks))
+        self.logger.info("Lecture Blocks: %d", len(lecture_blocks))
+        self.logger.info("Lab Blocks: %d", len(lab_blocks))
 
         return blocks
 
-    def get_block_score(self, block: Block) -> tuple:
+    def get_block_score(self, block: Block, current_assignments=None) -> tuple:
+        """Score a block for priority ordering (higher sorts first).
+
+        Single source of truth for block scoring — _sort_blocks_by_priority
+        and any external caller go through here. Callers scoring many
+        blocks should pass the assignments view once instead of letting
+        each call re-fetch it.
+        """
         # Get possible rooms for this block
-        possible_rooms = self._get_possible_rooms(block)
+        possible_rooms = self._get_suitable_rooms_cached(block)
 
         # Calculate total available time slots across all possible rooms
         total_available_slots = 0
-        current_assignments = (
-            self.constraint_manager.get_all_assignments()
-        )  # FIX: Get from constraint manager
+        if current_assignments is None:
+            current_assignments = self.constraint_manager.assignments_view
 
         for room in possible_rooms:
             available_slots = self.resource_manager.get_available_slots(
-                block,
-                room,
-                current_assignments,  # FIX: Use assignments from constraint manager
+                block, room, current_assignments
             )
             total_available_slots += len(available_slots)
 
@@ -475,23 +725,18 @@ class SchedulingEngine:
             priority_score,
         )
 
-        sorted_blocks = sorted(blocks, key=get_block_score, reverse=True)
-
-        self.logger.debug("Block priority order:")
-        for i, block in enumerate(sorted_blocks[:5]):  # Log first 5
-            score = get_block_score(block)
-            self.logger.debug(f"  {i+1}. {block.id} - Score: {score}")
-
-        return sorted_blocks
-
     def _get_possible_rooms(self, block: Block) -> List[Union[Hall, Lab]]:
         """Get list of possible rooms for a block"""
-        rooms = self.resource_manager.get_suitable_rooms(block)
-        self.logger.debug(f"Block {block.id} has {len(rooms)} possible rooms")
-        return rooms
+        rooms = self._get_suitable_rooms_cached(block)
+        self.logger.debug("Block %s has %d possible rooms", block.id, len(rooms))
+        return list(rooms)
 
     def _calculate_block_priority(self, block: Block) -> float:
         """Calculate priority score for a block"""
+        cached = self._priority_cache.get(block.id)
+        if cached is not None:
+            return cached
+
         score = 0.0
 
         # Preferred rooms increase priority
@@ -513,6 +758,7 @@ class SchedulingEngine:
         # Larger groups get higher priority
         score += block.student_count / 100.0
 
+        self._priority_cache[block.id] = score
         return score
 
     def _get_possible_slots(
@@ -529,121 +775,154 @@ class SchedulingEngine:
         )
 
         self.logger.debug(
-            f"Block {block.id} in room {room.name} has {len(slots)} possible slots"
+            "Block %s in room %s has %d possible slots", block.id, room.name, len(slots)
         )
         return slots
 
     def _debug_constraint_check(self, block, slot, room, current_assignments):
         """Debug version of constraint checking with detailed logging"""
         room_type, room_id = get_room_key(room)
-        self.logger.debug(f"\n=== DEBUGGING CONSTRAINT CHECK ===")
-        self.logger.debug(
-            f"Block: {block.id} ({block.course_object.course_code} {block.block_type.value})"
-        )
-        self.logger.debug(
-            f"Staff: {block.staff_member.name} (ID: {block.staff_member.id}, Type: {type(block.staff_member.id)})"
-        )
-        self.logger.debug(f"Room: {room.name} (ID: {room_id}, Type: {type(room_id)})")
-        self.logger.debug(f"Time: {slot.day.name} {slot.start_time}")
-        self.logger.debug(f"Current assignments: {len(current_assignments)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("\n=== DEBUGGING CONSTRAINT CHECK ===")
+            self.logger.debug(
+                f"Block: {block.id} ({block.course_object.course_code} {block.block_type.value})"
+            )
+            self.logger.debug(
+                f"Staff: {block.staff_member.name} (ID: {block.staff_member.id}, Type: {type(block.staff_member.id)})"
+            )
+            self.logger.debug(
+                f"Room: {room.name} (ID: {room_id}, Type: {type(room_id)})"
+            )
+            self.logger.debug(f"Time: {slot.day.name} {slot.start_time}")
+            self.logger.debug(f"Current assignments: {len(current_assignments)}")
 
-        # Manual conflict checking
+        # Manual conflict checking against the shared time bucketing — only
+        # the bucket for this slot can conflict, so there is no need to
+        # rescan every assignment the way this used to
         slot_key = (slot.day, slot.start_time)
+        room_key = get_room_key(room)
+        staff_id = block.staff_member.id
 
-        # Check for room conflicts manually
         room_conflicts = []
         staff_conflicts = []
 
-        for existing_id, existing_assignment in current_assignments.items():
-            existing_slot_key = (
-                existing_assignment.time_slot.day,
-                existing_assignment.time_slot.start_time,
-            )
-
-            if existing_slot_key == slot_key:
-                # Same time slot - check for conflicts
-                if get_room_key(existing_assignment.room) == get_room_key(room):
-                    room_conflicts.append(existing_id)
-                    self.logger.warning(
-                        f"MANUAL CHECK: Room conflict with {existing_id}"
-                    )
+        by_time = self._group_assignments_by_time(current_assignments)
+        for existing_id, existing_assignment in by_time.get(slot_key, ()):
+            if get_room_key(existing_assignment.room) == room_key:
+                room_conflicts.append(existing_id)
+                self.logger.warning("MANUAL CHECK: Room conflict with %s", existing_id)
 
-                if existing_assignment.block.staff_member.id == block.staff_member.id:
-                    staff_conflicts.append(existing_id)
-                    self.logger.warning(
-                        f"MANUAL CHECK: Staff conflict with {existing_id}"
-                    )
+            if existing_assignment.block.staff_member.id == staff_id:
+                staff_conflicts.append(existing_id)
+                self.logger.warning("MANUAL CHECK: Staff conflict with %s", existing_id)
 
         # Compare with constraint manager result
-        is_valid, violation = self.constraint_manager.check_all_constraints(
-            block, slot, room, current_assignments
-        )
+        is_valid, violation = self.constraint_manager.can_assign(block, slot, room)
 
         self.logger.debug(
-            f"Constraint manager result: {'VALID' if is_valid else 'INVALID'}"
+            "Constraint manager result: %s", "VALID" if is_valid else "INVALID"
         )
         if not is_valid:
-            self.logger.debug(f"Violation: {violation}")
+            self.logger.debug("Violation: %s", violation)
 
         # Compare results
         expected_conflicts = len(room_conflicts) > 0 or len(staff_conflicts) > 0
         if expected_conflicts and is_valid:
             self.logger.error(
-                f"CONSTRAINT MANAGER BUG: Should have detected conflicts but didn't!"
+                "CONSTRAINT MANAGER BUG: Should have detected conflicts but didn't!"
             )
-            self.logger.error(f"Room conflicts: {room_conflicts}")
-            self.logger.error(f"Staff conflicts: {staff_conflicts}")
+            self.logger.error("Room conflicts: %s", room_conflicts)
+            self.logger.error("Staff conflicts: %s", staff_conflicts)
         elif not expected_conflicts and not is_valid:
             self.logger.error(
-                f"CONSTRAINT MANAGER BUG: Detected conflict when none exists!"
+                "CONSTRAINT MANAGER BUG: Detected conflict when none exists!"
             )
-            self.logger.error(f"Violation reported: {violation}")
+            self.logger.error("Violation reported: %s", violation)
         else:
-            self.logger.debug(f"Constraint manager working correctly")
+            self.logger.debug("Constraint manager working correctly")
 
         return is_valid, violation
 
-    def _local_search_with_constraint_manager(self, max_iterations: int = 50) -> bool:
-        """Improve schedule using local search with ConstraintManager"""
+    def _local_search_with_constraint_manager(
+        self, max_iterations: int = 50, samples_per_iteration: int = 40
+    ) -> bool:
+        """Improve schedule using local search with ConstraintManager.
+
+        Instead of attempting every (i, j) assignment pair — O(N²) swap
+        trials per iteration, each costing four constraint-manager
+        mutations — sample a fixed number of random candidate swaps per
+        iteration and accept by the simulated-annealing criterion: always
+        take improvements, occasionally take small regressions early on
+        (the temperature decays geometrically) to escape local optima.
+        A short tabu list keeps recently swapped pairs from thrashing.
+        """
         self.logger.debug("Starting local search optimization...")
 
         current_assignments = self.constraint_manager.get_all_assignments()
+        assignment_ids = list(current_assignments.keys())
+        if len(assignment_ids) < 2:
+            return False
+
         current_score = self._evaluate_schedule(current_assignments)
         improved = False
+        temperature = 1.0
+        tabu = deque(maxlen=50)
 
         for iteration in range(max_iterations):
-            assignment_ids = list(current_assignments.keys())
-
-            for i in range(len(assignment_ids)):
-                for j in range(i + 1, len(assignment_ids)):
-                    block_id1, block_id2 = assignment_ids[i], assignment_ids[j]
-                    assignment1 = current_assignments[block_id1]
-                    assignment2 = current_assignments[block_id2]
-
-                    # Try swapping rooms using ConstraintManager
-                    if self._try_swap_rooms(
-                        block_id1, block_id2, assignment1, assignment2
-                    ):
-                        new_score = self._evaluate_schedule(
-                            self.constraint_manager.get_all_assignments()
-                        )
-                        if new_score > current_score:
-                            current_score = new_score
-                            current_assignments = (
-                                self.constraint_manager.get_all_assignments()
-                            )
+            for _ in range(samples_per_iteration):
+                block_id1, block_id2 = random.sample(assignment_ids, 2)
+                pair = (
+                    (block_id1, block_id2)
+                    if block_id1 < block_id2
+                    else (block_id2, block_id1)
+                )
+                if pair in tabu:
+                    continue
+
+                assignment1 = current_assignments[block_id1]
+                assignment2 = current_assignments[block_id2]
+
+                # Fast feasibility pre-check: a swap can only succeed if
+                # each room is suitable for the other block, so skip the
+                # four-mutation trial when it is doomed anyway
+                if (
+                    assignment2.room
+                    not in self._get_suitable_rooms_cached(assignment1.block)
+                    or assignment1.room
+                    not in self._get_suitable_rooms_cached(assignment2.block)
+                ):
+                    continue
+
+                # Try swapping rooms using ConstraintManager
+                if self._try_swap_rooms(block_id1, block_id2, assignment1, assignment2):
+                    new_assignments = self.constraint_manager.get_all_assignments()
+                    new_score = self._evaluate_schedule(new_assignments)
+                    delta = new_score - current_score
+
+                    if delta > 0 or random.random() < exp(delta / temperature):
+                        current_score = new_score
+                        current_assignments = new_assignments
+                        if delta > 0:
                             improved = True
                             self.logger.debug(
-                                f"Improved by swapping rooms: {block_id1} <-> {block_id2}"
-                            )
-                        else:
-                            # Undo the swap
-                            self._try_swap_rooms(
-                                block_id1, block_id2, assignment2, assignment1
+                                "Improved by swapping rooms: %s <-> %s",
+                                block_id1,
+                                block_id2,
                             )
+                    else:
+                        # Undo the swap (swap the now-current assignments back)
+                        self._try_swap_rooms(
+                            block_id1,
+                            block_id2,
+                            new_assignments[block_id1],
+                            new_assignments[block_id2],
+                        )
+                        current_assignments = (
+                            self.constraint_manager.get_all_assignments()
+                        )
+                    tabu.append(pair)
 
-            if not improved:
-                break
+            temperature *= 0.995
 
         return improved
 
@@ -690,15 +969,10 @@ class SchedulingEngine:
         if not assignments:
             return 0.0
 
-        total_score = 0.0
-        for assignment in assignments.values():
-            # Get soft constraint score
-            score = self.constraint_manager.evaluate_soft_constraints(
-                assignment.block, assignment.time_slot, assignment.room
-            )
-            total_score += score
-
-        return total_score / len(assignments)
+        scores = self.constraint_manager.evaluate_soft_constraints_batch(
+            assignments.values()
+        )
+        return sum(scores) / len(scores)
 
     def _is_better_attempt(self, attempt: SchedulingAttempt) -> bool:
         """Determine if new attempt is better than current best"""
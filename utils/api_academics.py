@@ -1,12 +1,28 @@
 # utils/api_academics.py
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from models.academic_list import AcademicList, Course
 from models.department import Department
 from utils.api_departments import convert_api_department
 
+# Converted objects keyed by API id — the same course shows up in several
+# academic lists (electives, cross-listed courses) and the same list can
+# be requested more than once per generation run
+_COURSE_CACHE: Dict[int, Course] = {}
+_ACADEMIC_LIST_CACHE: Dict[int, AcademicList] = {}
+
+
+def clear_course_cache():
+    """Drop cached Course and AcademicList conversions.
+
+    Call between runs if the API data may have changed underneath."""
+    _COURSE_CACHE.clear()
+    _ACADEMIC_LIST_CACHE.clear()
+
 
 def convert_api_course(course_data: Dict[str, Any]) -> Course:
     """
@@ -21,32 +37,43 @@ def convert_api_course(course_data: Dict[str, Any]) -> Course:
     if not course_data or not isinstance(course_data, dict):
         raise ValueError(f"Invalid course data: {course_data}")
 
-    # Extract required fields
-    id = course_data.get("id")
-    code = course_data.get("code")
-    name_en = course_data.get("nameEn") or course_data.get("name")
-    name_ar = course_data.get("nameAr")
+    # Extract required fields — bind .get once and index directly where a
+    # missing key is a data error the caller already handles
+    g = course_data.get
+    id = g("id")
+    if id is not None:
+        cached = _COURSE_CACHE.get(id)
+        if cached is not None:
+            return cached
+
+    code = course_data["code"]
+    name_en = g("nameEn") or course_data["name"]
+    name_ar = g("nameAr")
 
     # Convert hours ensuring correct types (API might return strings)
     try:
-        lecture_hours = int(course_data.get("lectureHours", 0))
-        practical_hours = int(course_data.get("practicalHours", 0))
-        credit_hours = int(course_data.get("creditHours", 0))
+        lecture_hours = int(g("lectureHours", 0))
+        practical_hours = int(g("practicalHours", 0))
+        credit_hours = int(g("creditHours", 0))
     except (ValueError, TypeError) as e:
-        logging.error(f"Error converting hours for course {name_en}: {str(e)}")
+        logging.error("Error converting hours for course %s: %s", name_en, e)
         lecture_hours = 0
         practical_hours = 0
         credit_hours = 0
 
     # Check for prerequisite course (if available)
-    prerequisite_course = course_data.get("prerequisiteCourse", None)
+    prerequisite_course = g("prerequisiteCourse", None)
 
     logging.debug(
-        f"Converting course: {code} - {name_en} ({lecture_hours}+{practical_hours} hrs)"
+        "Converting course: %s - %s (%s+%s hrs)",
+        code,
+        name_en,
+        lecture_hours,
+        practical_hours,
     )
 
     # Create and return the Course object
-    return Course(
+    course = Course(
         id=id,
         code=code,
         name_en=name_en,
@@ -57,6 +84,14 @@ def convert_api_course(course_data: Dict[str, Any]) -> Course:
         prerequisite_course=prerequisite_course,
     )
 
+    # Validation is opt-in so bulk loads skip the per-object checks
+    if os.environ.get("SCHEDU_VALIDATE"):
+        course.validate()
+
+    if id is not None:
+        _COURSE_CACHE[id] = course
+    return course
+
 
 def convert_api_academic_list_summary(
     academic_list_data: Dict[str, Any],
@@ -83,7 +118,7 @@ def convert_api_academic_list_summary(
     department_data = academic_list_data.get("department", {})
     department = convert_api_department(department_data)
 
-    logging.debug(f"Converting academic list summary: {name} (ID: {academic_id})")
+    logging.debug("Converting academic list summary: %s (ID: %s)", name, academic_id)
 
     return {
         "id": academic_id,
@@ -110,6 +145,10 @@ def convert_api_academic_list_detail(
         raise ValueError(f"Invalid academic list data: {academic_list_data}")
 
     academic_id = academic_list_data.get("id")
+    if academic_id is not None:
+        cached = _ACADEMIC_LIST_CACHE.get(academic_id)
+        if cached is not None:
+            return cached
 
     # Extract basic information
     name = academic_list_data.get("nameEn") or academic_list_data.get("name")
@@ -118,17 +157,33 @@ def convert_api_academic_list_detail(
     department_data = academic_list_data.get("department", {})
     department = convert_api_department(department_data)
 
-    # Convert courses
-    courses = []
-    for course_data in academic_list_data.get("courses", []):
+    def _safe_convert(course_data):
         try:
-            course = convert_api_course(course_data)
-            courses.append(course)
+            return convert_api_course(course_data)
         except Exception as e:
-            logging.error(f"Error converting course in academic list {name}: {str(e)}")
-
-    logging.debug(f"Converting academic list: {name} with {len(courses)} courses")
-
-    return AcademicList(
+            logging.error("Error converting course in academic list %s: %s", name, e)
+            return None
+
+    # Convert courses. Large lists fan out over a small thread pool so the
+    # per-course Python work overlaps with log-handler I/O; short lists
+    # are not worth the pool startup.
+    course_data_list = academic_list_data.get("courses", [])
+    if len(course_data_list) > 16:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            converted = executor.map(_safe_convert, course_data_list)
+            courses = [course for course in converted if course is not None]
+    else:
+        courses = [
+            course
+            for course in map(_safe_convert, course_data_list)
+            if course is not None
+        ]
+
+    logging.debug("Converting academic list: %s with %d courses", name, len(courses))
+
+    academic_list = AcademicList(
         id=academic_id, name=name, department=department, courses=courses
     )
+    if academic_id is not None:
+        _ACADEMIC_LIST_CACHE[academic_id] = academic_list
+    return academic_list
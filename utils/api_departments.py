@@ -2,11 +2,22 @@
 
 
 import logging
+from functools import lru_cache
 from typing import List
 
 from models.department import Department
 
 
+@lru_cache(maxsize=None)
+def _make_department(department_id: int, name: str) -> Department:
+    return Department(id=department_id, name=name)
+
+
 def convert_api_department(department_data: dict) -> Department:
-    """Convert API department data to Department object."""
-    return Department(id=department_data["id"], name=department_data["name"])
+    """Convert API department data to Department object.
+
+    The same handful of departments show up on every academic list and
+    staff record, so instances are memoized by (id, name) instead of
+    being rebuilt per call.
+    """
+    return _make_department(department_data["id"], department_data["name"])
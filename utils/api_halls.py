@@ -11,8 +11,7 @@ def convert_api_hall(hall_data: dict) -> Hall:
     name = hall_data["name"]
     capacity = hall_data["capacity"]
 
-    availability = []
-    for time_pref_data in hall_data["availability"]:
-        availability.append(convert_api_time_preference(time_pref_data))
+    # map() runs the conversion loop in C instead of per-item bytecode
+    availability = list(map(convert_api_time_preference, hall_data["availability"]))
 
     return Hall(hall_id, name, capacity, availability)
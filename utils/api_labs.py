@@ -10,22 +10,22 @@ from utils.time_utils import convert_api_time_preference
 
 def convert_api_lab_type(type_str: str) -> LabType:
     """Convert lab type string from API to LabType enum"""
-    logging.debug(f"Converting lab type: '{type_str}'")
+    logging.debug("Converting lab type: '%s'", type_str)
 
     if not type_str:
-        logging.warning(f"Empty lab type provided, defaulting to GENERAL")
+        logging.warning("Empty lab type provided, defaulting to GENERAL")
         return LabType.GENERAL
 
     type_str = str(type_str).lower()  # Force string and lowercase
 
     if type_str == "specialist":
-        logging.debug(f"Converted to SPECIALIST")
+        logging.debug("Converted to SPECIALIST")
         return LabType.SPECIALIST
     elif type_str == "general":
-        logging.debug(f"Converted to GENERAL")
+        logging.debug("Converted to GENERAL")
         return LabType.GENERAL
     else:
-        logging.warning(f"Unknown lab type '{type_str}', defaulting to GENERAL")
+        logging.warning("Unknown lab type '%s', defaulting to GENERAL", type_str)
         return LabType.GENERAL
 
 
@@ -37,22 +37,27 @@ def convert_api_lab(lab_data: dict) -> Lab:
 
     # Extract and log the lab type for debugging
     raw_lab_type = lab_data.get("labType", "general")
-    logging.debug(f"Lab {name} (ID: {lab_id}) has raw labType: '{raw_lab_type}'")
+    logging.debug("Lab %s (ID: %s) has raw labType: '%s'", name, lab_id, raw_lab_type)
 
     lab_type = convert_api_lab_type(raw_lab_type)
 
     # Convert 0/1 to boolean - Laravel uses 0/1 for boolean values
     used_in_non_specialist = bool(lab_data.get("usedInNonSpecialistCourses", 1))
     logging.debug(
-        f"Lab {name} (ID: {lab_id}) used_in_non_specialist: {used_in_non_specialist}"
+        "Lab %s (ID: %s) used_in_non_specialist: %s",
+        name,
+        lab_id,
+        used_in_non_specialist,
     )
 
-    availability = []
-    for time_pref_data in lab_data["availability"]:
-        availability.append(convert_api_time_preference(time_pref_data))
+    availability = list(map(convert_api_time_preference, lab_data["availability"]))
 
     lab = Lab(lab_id, name, capacity, availability, lab_type, used_in_non_specialist)
+    # %-style defers the Lab repr until a DEBUG handler actually formats it
     logging.debug(
-        f"Converted lab: {lab} with type {lab.lab_type} and used_in_non_specialist={lab.used_in_non_specialist_courses}"
+        "Converted lab: %s with type %s and used_in_non_specialist=%s",
+        lab,
+        lab.lab_type,
+        lab.used_in_non_specialist_courses,
     )
     return lab
@@ -1,16 +1,42 @@
 # utils/api_schedule.py
 
+import io
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.halls import Hall
 from models.labs import Lab
+from models.time_preferences import Day
 from scheduler import Assignment, BlockType
 
 # Set up logging
 logger = logging.getLogger("utils.api_schedule")
 
+# "HH:MM" strings keyed by time object — a schedule only uses a couple of
+# dozen distinct slot times, so strftime runs once per distinct time
+# instead of twice per assignment
+_TIME_STR_CACHE: Dict[Any, str] = {}
+
+
+# Enum-keyed lookup tables — one dict probe per assignment instead of an
+# enum comparison and a fresh .lower() string
+_SESSION_TYPE = {BlockType.LECTURE: "lecture", BlockType.LAB: "lab"}
+_DAY_NAME = {day: day.name.lower() for day in Day}
+
+
+def _format_time(t) -> str:
+    s = _TIME_STR_CACHE.get(t)
+    if s is None:
+        s = _TIME_STR_CACHE[t] = t.strftime("%H:%M")
+    return s
+
 
 def convert_assignments_to_api_format(
     assignments: Dict[str, Assignment], schedule_name_en: str, schedule_name_ar: str
@@ -26,23 +52,78 @@ def convert_assignments_to_api_format(
     Returns:
         Dictionary in the format expected by the backend API
     """
-    logger.info(f"Converting {len(assignments)} assignments to API format")
+    logger.info("Converting %d assignments to API format", len(assignments))
+
+    # Convert in one right-sized comprehension instead of append-per-entry
+    try:
+        schedule = [
+            convert_single_assignment(assignment)
+            for assignment in assignments.values()
+        ]
+    except Exception as e:
+        logger.error("Failed to convert assignments: %s", str(e))
+        raise  # Re-raise to stop processing on any error
+
+    api_data = {
+        "nameEn": schedule_name_en,
+        "nameAr": schedule_name_ar,
+        "schedule": schedule,
+    }
 
-    # Initialize the API format structure
-    api_data = {"nameEn": schedule_name_en, "nameAr": schedule_name_ar, "schedule": []}
+    logger.info("Successfully converted %d assignments", len(schedule))
+    return api_data
 
-    # Convert each assignment
-    for block_id, assignment in assignments.items():
-        try:
-            api_entry = convert_single_assignment(assignment)
-            api_data["schedule"].append(api_entry)
 
-        except Exception as e:
-            logger.error(f"Failed to convert assignment {block_id}: {str(e)}")
-            raise  # Re-raise to stop processing on any error
+def stream_assignments_to_api(
+    assignments: Dict[str, Assignment],
+    out_fp,
+    schedule_name_en: str,
+    schedule_name_ar: str,
+) -> int:
+    """
+    Stream the API payload to a binary file object entry by entry.
 
-    logger.info(f"Successfully converted {len(api_data['schedule'])} assignments")
-    return api_data
+    Serializes each assignment as it is converted, so the full schedule
+    list never sits in memory alongside its serialized form — use this
+    instead of convert_assignments_to_api_format when writing very large
+    schedules straight to disk.
+
+    Returns the number of entries written.
+    """
+    logger.info("Streaming %d assignments to API format", len(assignments))
+
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+
+        def dumps(obj):
+            return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    header = (
+        b'{"nameEn":'
+        + dumps(schedule_name_en)
+        + b',"nameAr":'
+        + dumps(schedule_name_ar)
+        + b',"schedule":['
+    )
+
+    written = 0
+    # Batch the small per-entry writes into 64 KiB chunks
+    buffer = io.BufferedWriter(out_fp, buffer_size=65536)
+    try:
+        buffer.write(header)
+        for assignment in assignments.values():
+            if written:
+                buffer.write(b",")
+            buffer.write(dumps(convert_single_assignment(assignment)))
+            written += 1
+        buffer.write(b"]}")
+        buffer.flush()
+    finally:
+        buffer.detach()
+
+    logger.info("Successfully streamed %d assignments", written)
+    return written
 
 
 def convert_single_assignment(assignment: Assignment) -> Dict[str, Any]:
@@ -58,59 +139,40 @@ def convert_single_assignment(assignment: Assignment) -> Dict[str, Any]:
     block = assignment.block
     room = assignment.room
     time_slot = assignment.time_slot
+    academic_list = block.academic_list_object
 
-    # Get course ID from CourseAssignment object
-    course_id = block.course_object.course_id
-
-    # Determine session type
-    session_type = "lecture" if block.block_type == BlockType.LECTURE else "lab"
-
-    # Create group info
-    group_info = {
-        "group_number": block.group_number,
-        "total_groups": block.total_groups,
-    }
-
-    # Determine room assignments
-    hall_id = None
-    lab_id = None
-
-    if isinstance(room, Hall):
+    # Determine room assignments. Halls and Labs are leaf classes, so an
+    # exact type check is enough and skips the isinstance MRO walk in the
+    # hottest conversion path.
+    room_type = type(room)
+    if room_type is Hall:
         hall_id = room.id
         lab_id = None
-    elif isinstance(room, Lab):
+    elif room_type is Lab:
         hall_id = None
         lab_id = room.id
     else:
         raise ValueError(f"Unknown room type for room: {room}")
 
-    # Get lecturer/TA ID
-    lecturer_id = block.staff_member.id
-
-    # Create time slot info
-    time_slot_info = {
-        "day": time_slot.day.name.lower(),
-        "start_time": time_slot.start_time.strftime("%H:%M"),
-        "end_time": time_slot.end_time.strftime("%H:%M"),
-    }
-
-    # Get academic information from AcademicList object
-    academic_id = block.academic_list_object.id
-    department_id = block.academic_list_object.department.id
-
-    # Create the API entry
-    api_entry = {
-        "course_id": course_id,
-        "session_type": session_type,
-        "group_info": group_info,
+    # Build the API entry as one literal — group and time-slot sub-dicts
+    # inline, each attribute chain read exactly once
+    return {
+        "course_id": block.course_object.course_id,
+        "session_type": _SESSION_TYPE[block.block_type],
+        "group_info": {
+            "group_number": block.group_number,
+            "total_groups": block.total_groups,
+        },
         "hall_id": hall_id,
         "lab_id": lab_id,
-        "lecturer_id": lecturer_id,
-        "time_slot": time_slot_info,
+        "lecturer_id": block.staff_member.id,
+        "time_slot": {
+            "day": _DAY_NAME[time_slot.day],
+            "start_time": _format_time(time_slot.start_time),
+            "end_time": _format_time(time_slot.end_time),
+        },
         "student_count": block.student_count,
-        "academic_id": academic_id,
+        "academic_id": academic_list.id,
         "academic_level": block.academic_level,
-        "department_id": department_id,
+        "department_id": academic_list.department.id,
     }
-
-    return api_entry
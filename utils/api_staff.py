@@ -3,6 +3,7 @@
 
 import logging
 from datetime import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from models.department import Department
@@ -16,21 +17,24 @@ from utils.api_departments import convert_api_department
 from utils.time_utils import convert_api_time_preference
 
 
+@lru_cache(maxsize=None)
+def _make_academic_degree(degree_id: int, name: str, prefix: str) -> AcademicDegree:
+    return AcademicDegree(id=degree_id, name=name, prefix=prefix)
+
+
 def convert_api_academic_degree(degree_data: Dict[str, Any]) -> AcademicDegree:
-    """Convert API academic degree data to AcademicDegree object."""
-    return AcademicDegree(
-        id=degree_data["id"], name=degree_data["name"], prefix=degree_data["prefix"]
+    """Convert API academic degree data to AcademicDegree object.
+
+    A handful of degrees are shared across every staff record, so
+    instances are memoized by (id, name, prefix).
+    """
+    return _make_academic_degree(
+        degree_data["id"], degree_data["name"], degree_data["prefix"]
     )
 
 
-def is_lecturer_degree(degree: AcademicDegree) -> bool:
-    """Check if the academic degree corresponds to a lecturer role"""
-    lecturer_degree_ids = {
-        1,
-        2,
-        3,
-    }
-    return degree in lecturer_degree_ids
+# Academic degree ids that correspond to a lecturer role
+_LECTURER_DEGREE_IDS = frozenset({1, 2, 3})
 
 
 def convert_api_staff_member(staff_data: Dict[str, Any]) -> StaffMember:
@@ -54,17 +58,20 @@ def convert_api_staff_member(staff_data: Dict[str, Any]) -> StaffMember:
     academic_degree = convert_api_academic_degree(degree_data)
 
     # Convert timing preferences
-    timing_preferences = []
-    for pref_data in staff_data.get("timingPreference", []):
-        timing_preferences.append(convert_api_time_preference(pref_data))
+    timing_preferences = list(
+        map(convert_api_time_preference, staff_data.get("timingPreference", []))
+    )
 
     # Convert isPermanent to boolean (handles 0/1 values)
     is_permanent = bool(staff_data.get("isPermanent", 1))
 
     # Determine the correct staff type based on academic degree
-    if is_lecturer_degree(academic_degree.id):
+    if academic_degree.id in _LECTURER_DEGREE_IDS:
         logging.debug(
-            f"Creating Lecturer: {name} (ID: {staff_id}), Degree: {academic_degree.name}"
+            "Creating Lecturer: %s (ID: %s), Degree: %s",
+            name,
+            staff_id,
+            academic_degree.name,
         )
         return Lecturer(
             id=staff_id,
@@ -76,7 +83,10 @@ def convert_api_staff_member(staff_data: Dict[str, Any]) -> StaffMember:
         )
     else:
         logging.debug(
-            f"Creating TeachingAssistant: {name} (ID: {staff_id}), Degree: {academic_degree.name}"
+            "Creating TeachingAssistant: %s (ID: %s), Degree: %s",
+            name,
+            staff_id,
+            academic_degree.name,
         )
         return TeachingAssistant(
             id=staff_id,
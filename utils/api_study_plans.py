@@ -1,11 +1,17 @@
 # utils/api_study_plans.py - Enhanced with comprehensive logging
 
 import logging
+import os
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from backend.get_academics import get_academic_list_by_id
 from backend.get_labs import get_labs
-from backend.get_staff_members import get_staff_member_by_id
+from backend.get_staff_members import (
+    get_staff_member_by_id,
+    get_staff_members_by_ids,
+)
 from models.academic_list import AcademicList
 from models.labs import Lab
 from models.staff_members import Lecturer, TeachingAssistant
@@ -14,40 +20,53 @@ from utils.api_academics import convert_api_academic_list_summary
 
 logger = logging.getLogger("utils.api_study_plans")
 
+# First digit run in an academic level string like "Level 1"
+_LEVEL_RE = re.compile(r"\d+")
 
+
+@lru_cache(maxsize=64)
 def extract_academic_level(level_str: str) -> int:
     """
     Extract numeric academic level from level string (e.g., "Level 1" -> 1)
 
+    The API only ever sends a handful of distinct strings ("Level 1"..
+    "Level 5"), so after warmup every call is a cache probe and the regex
+    never runs again.
+
     Args:
         level_str: String representation of academic level
 
     Returns:
         Integer academic level
     """
-    logger.debug(f"Extracting academic level from: '{level_str}'")
+    logger.debug("Extracting academic level from: '%s'", level_str)
 
     # Default to level 1 if parsing fails
     level = 1
 
     try:
-        # Try to extract numeric part from string like "Level 1"
-        if level_str:
-            # Remove non-numeric characters and convert to int
-            level_digits = "".join(filter(str.isdigit, level_str))
-            if level_digits:
-                level = int(level_digits)
+        # Grab the first digit run from a string like "Level 1"
+        match = _LEVEL_RE.search(level_str or "")
+        if match:
+            level = int(match.group())
     except (ValueError, TypeError) as e:
         logger.warning(
-            f"Failed to parse academic level '{level_str}', defaulting to 1: {e}"
+            "Failed to parse academic level '%s', defaulting to 1: %s", level_str, e
         )
 
-    logger.debug(f"Extracted academic level: {level}")
+    logger.debug("Extracted academic level: %s", level)
     return level
 
 
+def _pick_name(data: Dict[str, Any]) -> Optional[str]:
+    """English name when present, otherwise the generic name field."""
+    return data.get("nameEn") or data.get("name")
+
+
 def convert_api_lecturer_assignment(
-    lecturer_data: Dict[str, Any], fetch_lecturer: bool = True
+    lecturer_data: Dict[str, Any],
+    fetch_lecturer: bool = True,
+    staff_cache: Optional[Dict[int, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Convert API lecturer assignment data to lecturer assignment dictionary.
@@ -55,48 +74,56 @@ def convert_api_lecturer_assignment(
     Args:
         lecturer_data: Lecturer assignment data from API
         fetch_lecturer: Whether to fetch full lecturer details (if False, uses ID only)
+        staff_cache: Pre-fetched staff members by ID; when provided the
+            lecturer is looked up here instead of a per-call backend fetch
 
     Returns:
         Dictionary with lecturer assignment information
     """
-    logger.debug(f"Converting lecturer assignment: {lecturer_data}")
+    logger.debug("Converting lecturer assignment: %s", lecturer_data)
 
     lecturer_id = lecturer_data.get("id")
     num_groups = lecturer_data.get("num_groups", 1)
 
     logger.debug(
-        f"Lecturer ID: {lecturer_id}, Groups: {num_groups}, Fetch: {fetch_lecturer}"
+        "Lecturer ID: %s, Groups: %s, Fetch: %s", lecturer_id, num_groups, fetch_lecturer
     )
 
     lecturer_assignment = {}
 
     if fetch_lecturer:
         # Fetch detailed lecturer information
-        logger.debug(f"Fetching lecturer details for ID: {lecturer_id}")
-        lecturer = get_staff_member_by_id(lecturer_id)
+        logger.debug("Fetching lecturer details for ID: %s", lecturer_id)
+        if staff_cache is not None:
+            lecturer = staff_cache.get(lecturer_id)
+        else:
+            lecturer = get_staff_member_by_id(lecturer_id)
         if not lecturer or not isinstance(lecturer, Lecturer):
             logger.warning(
-                f"Failed to fetch lecturer with ID {lecturer_id}, creating placeholder"
+                "Failed to fetch lecturer with ID %s, creating placeholder", lecturer_id
             )
             # Create a placeholder lecturer (will be populated later)
             lecturer_assignment["lecturer_id"] = lecturer_id
             lecturer_assignment["num_of_groups"] = num_groups
         else:
-            logger.debug(f"Successfully fetched lecturer: {lecturer.name}")
+            logger.debug("Successfully fetched lecturer: %s", lecturer.name)
             lecturer_assignment["lecturer"] = lecturer
             lecturer_assignment["num_of_groups"] = num_groups
     else:
         # Just store ID for later resolution
-        logger.debug(f"Storing lecturer ID for later resolution: {lecturer_id}")
+        logger.debug("Storing lecturer ID for later resolution: %s", lecturer_id)
         lecturer_assignment["lecturer_id"] = lecturer_id
         lecturer_assignment["num_of_groups"] = num_groups
 
-    logger.debug(f"Lecturer assignment result: {list(lecturer_assignment.keys())}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Lecturer assignment result: %s", list(lecturer_assignment.keys()))
     return lecturer_assignment
 
 
 def convert_api_ta_assignment(
-    ta_data: Dict[str, Any], fetch_ta: bool = True
+    ta_data: Dict[str, Any],
+    fetch_ta: bool = True,
+    staff_cache: Optional[Dict[int, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Convert API teaching assistant assignment data to TA assignment dictionary.
@@ -104,170 +131,234 @@ def convert_api_ta_assignment(
     Args:
         ta_data: TA assignment data from API
         fetch_ta: Whether to fetch full TA details (if False, uses ID only)
+        staff_cache: Pre-fetched staff members by ID; when provided the TA
+            is looked up here instead of a per-call backend fetch
 
     Returns:
         Dictionary with TA assignment information
     """
-    logger.debug(f"Converting TA assignment: {ta_data}")
+    logger.debug("Converting TA assignment: %s", ta_data)
 
     ta_id = ta_data.get("id")
     num_groups = ta_data.get("num_groups", 1)
 
-    logger.debug(f"TA ID: {ta_id}, Groups: {num_groups}, Fetch: {fetch_ta}")
+    logger.debug("TA ID: %s, Groups: %s, Fetch: %s", ta_id, num_groups, fetch_ta)
 
     ta_assignment = {}
 
     if fetch_ta:
         # Fetch detailed TA information
-        logger.debug(f"Fetching TA details for ID: {ta_id}")
-        ta = get_staff_member_by_id(ta_id)
+        logger.debug("Fetching TA details for ID: %s", ta_id)
+        if staff_cache is not None:
+            ta = staff_cache.get(ta_id)
+        else:
+            ta = get_staff_member_by_id(ta_id)
         if not ta or not isinstance(ta, TeachingAssistant):
             logger.warning(
-                f"Failed to fetch teaching assistant with ID {ta_id}, creating placeholder"
+                "Failed to fetch teaching assistant with ID %s, creating placeholder",
+                ta_id,
             )
-            logger.warning(f"TA fetch result: {ta}, Type: {type(ta) if ta else 'None'}")
+            logger.warning("TA fetch result: %s, Type: %s", ta, type(ta) if ta else "None")
             # Create a placeholder TA (will be populated later)
             ta_assignment["teaching_assistant_id"] = ta_id
             ta_assignment["num_of_groups"] = num_groups
         else:
-            logger.debug(f"Successfully fetched TA: {ta.name}")
+            logger.debug("Successfully fetched TA: %s", ta.name)
             ta_assignment["teaching_assistant"] = ta
             ta_assignment["num_of_groups"] = num_groups
     else:
         # Just store ID for later resolution
-        logger.debug(f"Storing TA ID for later resolution: {ta_id}")
+        logger.debug("Storing TA ID for later resolution: %s", ta_id)
         ta_assignment["teaching_assistant_id"] = ta_id
         ta_assignment["num_of_groups"] = num_groups
 
-    logger.debug(f"TA assignment result: {list(ta_assignment.keys())}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("TA assignment result: %s", list(ta_assignment.keys()))
     return ta_assignment
 
 
+def _convert_course_assignment_fast(assignment_data: Dict[str, Any]) -> CourseAssignment:
+    """Structural-only conversion: no fetches, no per-field logging.
+
+    Mirrors convert_api_course_assignment with resolve_refs=False; taken
+    when the caller needs just the shape of the data and INFO logging is
+    off, so none of the verbose path's work would be observable anyway.
+    """
+    get = assignment_data.get
+    course_id = get("course_id")
+    course_code = get("course", {}).get("code") or f"COURSE_{course_id}"
+    lab_groups = get("lab_groups", 0)
+
+    lecturers = [
+        {"lecturer_id": ld.get("id"), "num_of_groups": ld.get("num_groups", 1)}
+        for ld in get("lecturers", [])
+    ]
+    teaching_assistants = None
+    if lab_groups > 0:
+        teaching_assistants = [
+            {
+                "teaching_assistant_id": td.get("id"),
+                "num_of_groups": td.get("num_groups", 1),
+            }
+            for td in get("teachingAssistants", [])
+        ]
+
+    course_assignment = CourseAssignment(
+        course_id=course_id,
+        course_code=course_code,
+        lecture_groups=get("lecture_groups", 1),
+        lecturers=lecturers,
+        lab_groups=lab_groups,
+        teaching_assistants=teaching_assistants,
+        practical_in_lab=not not get("practical_in_labs", True),
+        preferred_labs=None,
+        is_common=not not get("is_common"),
+    )
+
+    # Validation is opt-in so bulk loads skip the per-object checks
+    if os.environ.get("SCHEDU_VALIDATE"):
+        course_assignment.validate()
+
+    return course_assignment
+
+
 def convert_api_course_assignment(
     assignment_data: Dict[str, Any],
     resolve_refs: bool = True,
     academic_list: Optional[AcademicList] = None,
+    staff_cache: Optional[Dict[int, Any]] = None,
+    all_labs_by_id: Optional[Dict[int, Lab]] = None,
+    courses_by_id: Optional[Dict[int, Any]] = None,
 ) -> CourseAssignment:
     """Convert API course assignment data to CourseAssignment object."""
-    logger.info(f"=== CONVERTING COURSE ASSIGNMENT ===")
+    if not resolve_refs and not logger.isEnabledFor(logging.INFO):
+        return _convert_course_assignment_fast(assignment_data)
 
-    # Extract course information
-    course_id = assignment_data.get("course_id")
-    course_data = assignment_data.get("course", {})
+    logger.info("=== CONVERTING COURSE ASSIGNMENT ===")
+
+    # Extract course information — bind .get once for the repeated reads
+    get = assignment_data.get
+    course_id = get("course_id")
+    course_data = get("course", {})
     course_code = None
 
-    logger.info(f"Course ID: {course_id}")
-    logger.info(f"Course data: {course_data}")
+    logger.debug("Course ID: %s, course data: %s", course_id, course_data)
 
     # Try to find the course code
-    if course_data.get("code"):
-        course_code = course_data.get("code")
-        logger.info(f"Found course code in course data: {course_code}")
+    course_code = course_data.get("code")
+    if course_code:
+        logger.debug("Found course code in course data: %s", course_code)
     elif (
         resolve_refs and academic_list
     ):  # Use the passed academic_list instead of fetching
-        logger.info(f"Attempting to resolve course code from provided academic list...")
-        for course in academic_list.courses:
-            if course.id == course_id:
-                course_code = course.code
-                logger.info(f"Found course code in academic list: {course_code}")
-                break
+        logger.debug("Attempting to resolve course code from provided academic list...")
+        # Look the course up by id; build the index here only if the caller
+        # did not pass one in (plan-level conversion shares a single index)
+        if courses_by_id is None:
+            courses_by_id = {course.id: course for course in academic_list.courses}
+        course = courses_by_id.get(course_id)
+        if course is not None:
+            course_code = course.code
+            logger.debug("Found course code in academic list: %s", course_code)
 
         if not course_code:
             logger.warning(
-                f"Course ID {course_id} not found in academic list {academic_list.name}"
-            )
-            logger.warning(
-                f"Available courses: {[(c.id, c.code) for c in academic_list.courses]}"
+                "Course ID %s not found in academic list %s",
+                course_id,
+                academic_list.name,
             )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Available courses: %s",
+                    [(c.id, c.code) for c in academic_list.courses],
+                )
 
     if not course_code:
         # Use a placeholder code based on course ID if actual code not found
         course_code = f"COURSE_{course_id}"
         logger.warning(
-            f"Could not find course code for course ID {course_id}, using placeholder {course_code}"
+            "Could not find course code for course ID %s, using placeholder %s",
+            course_id,
+            course_code,
         )
 
     # Extract assignment details
-    lecture_groups = assignment_data.get("lecture_groups", 1)
-    lab_groups = assignment_data.get("lab_groups", 0)
-    is_common = bool(assignment_data.get("is_common", False))
-    practical_in_lab = bool(assignment_data.get("practical_in_labs", True))
-
-    logger.info(f"Course code: {course_code}")
-    logger.info(f"Lecture groups: {lecture_groups}")
-    logger.info(f"Lab groups: {lab_groups}")
-    logger.info(f"Is common: {is_common}")
-    logger.info(f"Practical in lab: {practical_in_lab}")
+    lecture_groups = get("lecture_groups", 1)
+    lab_groups = get("lab_groups", 0)
+    # not not normalizes the API's 0/1 flags to real bools without the
+    # builtin lookup and call that bool(...) costs per assignment
+    is_common = not not get("is_common")
+    practical_in_lab = not not get("practical_in_labs", True)
+
+    # One batched record instead of a burst of per-field calls — a single
+    # level check covers the whole context dump
+    logger.debug(
+        "Assignment code=%s lecture_groups=%s lab_groups=%s is_common=%s"
+        " practical_in_lab=%s",
+        course_code,
+        lecture_groups,
+        lab_groups,
+        is_common,
+        practical_in_lab,
+    )
 
     # Process lecturer assignments
-    logger.info(f"\n--- PROCESSING LECTURERS ---")
-    lecturers_data = assignment_data.get("lecturers", [])
-    logger.info(f"Lecturers data count: {len(lecturers_data)}")
-    logger.info(f"Lecturers data: {lecturers_data}")
-
-    lecturers = []
-    for i, lecturer_data in enumerate(lecturers_data):
-        logger.info(f"Processing lecturer {i+1}: {lecturer_data}")
-        lecturer_assignment = convert_api_lecturer_assignment(
-            lecturer_data, fetch_lecturer=resolve_refs
-        )
-        lecturers.append(lecturer_assignment)
-        logger.info(f"Lecturer {i+1} result: {list(lecturer_assignment.keys())}")
+    lecturers_data = get("lecturers", [])
+    logger.debug("Lecturers data (%d): %s", len(lecturers_data), lecturers_data)
 
-    logger.info(f"Total lecturers processed: {len(lecturers)}")
+    lecturers = [
+        convert_api_lecturer_assignment(
+            lecturer_data, fetch_lecturer=resolve_refs, staff_cache=staff_cache
+        )
+        for lecturer_data in lecturers_data
+    ]
 
     # Process teaching assistant assignments
-    logger.info(f"\n--- PROCESSING TEACHING ASSISTANTS ---")
-    tas_data = assignment_data.get("teachingAssistants", [])
-    logger.info(f"TAs data count: {len(tas_data)}")
-    logger.info(f"TAs data: {tas_data}")
+    tas_data = get("teachingAssistants", [])
+    logger.debug("TAs data (%d): %s", len(tas_data), tas_data)
 
     teaching_assistants = []
-    for i, ta_data in enumerate(tas_data):
-        logger.info(f"Processing TA {i+1}: {ta_data}")
-        ta_assignment = convert_api_ta_assignment(ta_data, fetch_ta=resolve_refs)
-        teaching_assistants.append(ta_assignment)
-        logger.info(f"TA {i+1} result: {list(ta_assignment.keys())}")
-
-    logger.info(f"Total TAs processed: {len(teaching_assistants)}")
+    if lab_groups > 0:
+        teaching_assistants = [
+            convert_api_ta_assignment(
+                ta_data, fetch_ta=resolve_refs, staff_cache=staff_cache
+            )
+            for ta_data in tas_data
+        ]
+    elif tas_data:
+        # The CourseAssignment drops TAs when there are no lab groups, so
+        # don't pay the per-TA conversion (and possible backend fetch)
+        # just to throw the result away
+        logger.debug("Skipping %d TA entries: course has no lab groups", len(tas_data))
 
     # Process preferred labs
-    logger.info(f"\n--- PROCESSING PREFERRED LABS ---")
-    preferred_labs_data = assignment_data.get("preferredLabs", [])
-    logger.info(f"Preferred labs data: {preferred_labs_data}")
+    preferred_labs_data = get("preferredLabs", [])
+    logger.debug("Preferred labs data: %s", preferred_labs_data)
 
     preferred_labs = []
     if resolve_refs and preferred_labs_data:
-        # Fetch actual Lab objects
-        logger.info("Resolving preferred labs...")
-        all_labs = get_labs()
-        logger.info(f"Available labs: {[lab.id for lab in all_labs]}")
+        # Resolve Lab objects from the prefetched index; only fetch if the
+        # caller did not supply one
+        if all_labs_by_id is None:
+            all_labs_by_id = {lab.id: lab for lab in get_labs()}
 
         for lab_data in preferred_labs_data:
             lab_id = lab_data.get("id")
-            logger.info(f"Looking for lab ID: {lab_id}")
-            for lab in all_labs:
-                if lab.id == lab_id:
-                    preferred_labs.append(lab)
-                    logger.info(f"Found preferred lab: {lab.name}")
-                    break
+            lab = all_labs_by_id.get(lab_id)
+            if lab is not None:
+                preferred_labs.append(lab)
+                logger.debug("Found preferred lab: %s", lab.name)
             else:
-                logger.warning(f"Preferred lab with ID {lab_id} not found")
-
-    logger.info(f"Preferred labs resolved: {[lab.name for lab in preferred_labs]}")
+                logger.warning("Preferred lab with ID %s not found", lab_id)
 
     # Create the CourseAssignment object
-    logger.info(f"\n--- CREATING COURSE ASSIGNMENT OBJECT ---")
-    logger.info(f"Final parameters:")
-    logger.info(f"  course_code: {course_code}")
-    logger.info(f"  lecture_groups: {lecture_groups}")
-    logger.info(f"  lecturers count: {len(lecturers)}")
-    logger.info(f"  lab_groups: {lab_groups}")
-    logger.info(f"  teaching_assistants count: {len(teaching_assistants)}")
-    logger.info(f"  practical_in_lab: {practical_in_lab}")
-    logger.info(f"  preferred_labs count: {len(preferred_labs)}")
-    logger.info(f"  is_common: {is_common}")
+    logger.debug(
+        "Creating CourseAssignment: lecturers=%d teaching_assistants=%d"
+        " preferred_labs=%d",
+        len(lecturers),
+        len(teaching_assistants),
+        len(preferred_labs),
+    )
 
     try:
         course_assignment = CourseAssignment(
@@ -282,22 +373,15 @@ def convert_api_course_assignment(
             is_common=is_common,
         )
 
-        logger.info(f"Successfully created CourseAssignment for {course_code}")
-
-        # Log final structure
-        logger.info(f"Final CourseAssignment structure:")
-        logger.info(f"  course_code: {course_assignment.course_code}")
-        logger.info(f"  lecture_groups: {course_assignment.lecture_groups}")
-        logger.info(f"  lab_groups: {course_assignment.lab_groups}")
-        logger.info(f"  lecturers: {len(course_assignment.lecturers)}")
-        logger.info(
-            f"  teaching_assistants: {len(course_assignment.teaching_assistants) if course_assignment.teaching_assistants else 0}"
-        )
+        # Validation is opt-in so bulk loads skip the per-object checks
+        if os.environ.get("SCHEDU_VALIDATE"):
+            course_assignment.validate()
 
+        logger.info("Successfully created CourseAssignment for %s", course_code)
         return course_assignment
 
     except Exception as e:
-        logger.error(f"Failed to create CourseAssignment: {str(e)}", exc_info=True)
+        logger.error("Failed to create CourseAssignment: %s", e, exc_info=True)
         raise
 
 
@@ -311,28 +395,29 @@ def convert_api_study_plan_summary(study_plan_data: Dict[str, Any]) -> Dict[str,
     Returns:
         Dictionary with study plan summary information
     """
-    logger.debug(f"Converting study plan summary: {study_plan_data}")
+    logger.debug("Converting study plan summary: %s", study_plan_data)
 
     if not study_plan_data or not isinstance(study_plan_data, dict):
         raise ValueError(f"Invalid study plan data: {study_plan_data}")
 
-    # Extract basic information
-    plan_id = study_plan_data.get("id")
-    name = study_plan_data.get("nameEn") or study_plan_data.get("name")
-    name_ar = study_plan_data.get("nameAr")
+    # Extract basic information — bind .get once for the repeated reads
+    get = study_plan_data.get
+    plan_id = get("id")
+    name = _pick_name(study_plan_data)
+    name_ar = get("nameAr")
 
     # Convert academic level string to integer
-    academic_level_str = study_plan_data.get("academicLevel", "Level 1")
+    academic_level_str = get("academicLevel", "Level 1")
     academic_level = extract_academic_level(academic_level_str)
 
     # Convert expected students to integer
-    expected_students = int(study_plan_data.get("expectedStudents", 0))
+    expected_students = int(get("expectedStudents", 0))
 
     # Get academic list information
-    academic_list_data = study_plan_data.get("academicList", {})
+    academic_list_data = get("academicList", {})
     academic_list_summary = convert_api_academic_list_summary(academic_list_data)
 
-    logger.debug(f"Converting study plan summary: {name} (ID: {plan_id})")
+    logger.debug("Converting study plan summary: %s (ID: %s)", name, plan_id)
 
     return {
         "id": plan_id,
@@ -346,7 +431,9 @@ def convert_api_study_plan_summary(study_plan_data: Dict[str, Any]) -> Dict[str,
 
 
 def convert_api_study_plan_detail(
-    study_plan_data: Dict[str, Any], resolve_refs: bool = True
+    study_plan_data: Dict[str, Any],
+    resolve_refs: bool = True,
+    academic_list_cache: Optional[Dict[int, AcademicList]] = None,
 ) -> StudyPlan:
     """
     Convert API study plan detail data to StudyPlan object.
@@ -354,97 +441,157 @@ def convert_api_study_plan_detail(
     Args:
         study_plan_data: Study plan detail data from the API
         resolve_refs: Whether to resolve references to other objects
+        academic_list_cache: Resolved academic lists by ID; callers
+            converting a batch of study plans share one dict so plans on
+            the same list don't re-fetch it
 
     Returns:
         StudyPlan object
     """
-    logger.info(f"=== CONVERTING STUDY PLAN DETAIL ===")
-    logger.info(f"Study plan data keys: {list(study_plan_data.keys())}")
-    logger.info(f"Resolve refs: {resolve_refs}")
+    logger.info("=== CONVERTING STUDY PLAN DETAIL ===")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Study plan data keys: %s, resolve refs: %s",
+            list(study_plan_data.keys()),
+            resolve_refs,
+        )
 
     if not study_plan_data or not isinstance(study_plan_data, dict):
         raise ValueError(f"Invalid study plan data: {study_plan_data}")
 
-    # Extract basic information
-    name = study_plan_data.get("nameEn") or study_plan_data.get("name")
+    # Extract basic information — bind .get once for the repeated reads
+    get = study_plan_data.get
+    name = _pick_name(study_plan_data)
 
-    logger.info(f"Study plan name: {name}")
+    logger.info("Study plan name: %s", name)
 
     # Convert academic level string to integer
-    academic_level_str = study_plan_data.get("academicLevel", "Level 1")
+    academic_level_str = get("academicLevel", "Level 1")
     academic_level = extract_academic_level(academic_level_str)
 
     # Convert expected students to integer
-    expected_students = int(study_plan_data.get("expectedStudents", 0))
-
-    logger.info(f"Academic level: {academic_level}")
-    logger.info(f"Expected students: {expected_students}")
+    expected_students = int(get("expectedStudents", 0))
 
     # Get academic list
-    academic_list_data = study_plan_data.get("academicList", {})
+    academic_list_data = get("academicList", {})
     academic_list_id = academic_list_data.get("id")
 
-    logger.info(f"Academic list ID: {academic_list_id}")
-    logger.info(f"Academic list data: {academic_list_data}")
+    # Batched context record — one dispatch instead of four
+    logger.debug(
+        "Plan context: academic_level=%s expected_students=%s academic_list_id=%s"
+        " academic_list_data=%s",
+        academic_level,
+        expected_students,
+        academic_list_id,
+        academic_list_data,
+    )
 
     academic_list = None
     if resolve_refs:
-        logger.info(f"Resolving academic list...")
-        academic_list = get_academic_list_by_id(academic_list_id)
+        if academic_list_cache is not None:
+            academic_list = academic_list_cache.get(academic_list_id)
+        if academic_list is None:
+            logger.debug("Resolving academic list...")
+            academic_list = get_academic_list_by_id(academic_list_id)
+            if academic_list and academic_list_cache is not None:
+                academic_list_cache[academic_list_id] = academic_list
 
     if not academic_list:
         logger.warning(
-            f"Could not fetch academic list with ID {academic_list_id} for study plan {name}"
+            "Could not fetch academic list with ID %s for study plan %s",
+            academic_list_id,
+            name,
         )
         # Create a minimal academic list with just the name
-        academic_list_name = academic_list_data.get("nameEn") or academic_list_data.get(
-            "name"
-        )
+        academic_list_name = _pick_name(academic_list_data)
         from models.department import Department
 
         academic_list = AcademicList(
             name=academic_list_name, department=Department(1, "general"), courses=[]
         )
 
-    logger.info(f"Academic list: {academic_list.name}")
+    logger.debug("Academic list: %s", academic_list.name)
+
+    # Index the list's courses by id once so each assignment resolves its
+    # course code with a dict probe instead of an O(courses) scan
+    courses_by_id = {course.id: course for course in academic_list.courses}
 
     # Process course assignments
-    logger.info(f"\n--- PROCESSING COURSE ASSIGNMENTS ---")
-    course_assignments_data = study_plan_data.get("courseAssignments", [])
-    logger.info(f"Course assignments count: {len(course_assignments_data)}")
+    course_assignments_data = get("courseAssignments", [])
+    logger.info("Course assignments count: %d", len(course_assignments_data))
+
+    # Prefetch every referenced lecturer/TA in one backend round-trip —
+    # the per-assignment converters would otherwise refetch the full staff
+    # list for every single ID (a classic N+1)
+    staff_cache = None
+    if resolve_refs and course_assignments_data:
+        staff_ids = {
+            staff_data["id"]
+            for assignment_data in course_assignments_data
+            for staff_data in (
+                assignment_data.get("lecturers", [])
+                + assignment_data.get("teachingAssistants", [])
+            )
+            if staff_data.get("id") is not None
+        }
+        if staff_ids:
+            staff_cache = get_staff_members_by_ids(staff_ids)
+
+    # Fetch the lab table once for the whole plan and index it by id —
+    # the converter would otherwise refetch it per course assignment
+    all_labs_by_id = None
+    if resolve_refs and any(
+        assignment_data.get("preferredLabs")
+        for assignment_data in course_assignments_data
+    ):
+        all_labs_by_id = {lab.id: lab for lab in get_labs()}
 
     course_assignments = []
     for i, assignment_data in enumerate(course_assignments_data):
         try:
-            logger.info(
-                f"\nProcessing course assignment {i+1}/{len(course_assignments_data)}"
+            logger.debug(
+                "Processing course assignment %d/%d",
+                i + 1,
+                len(course_assignments_data),
             )
             assignment = convert_api_course_assignment(
-                assignment_data, resolve_refs=resolve_refs, academic_list=academic_list
+                assignment_data,
+                resolve_refs=resolve_refs,
+                academic_list=academic_list,
+                staff_cache=staff_cache,
+                all_labs_by_id=all_labs_by_id,
+                courses_by_id=courses_by_id,
             )
             course_assignments.append(assignment)
-            logger.info(
-                f"Successfully processed course assignment {i+1}: {assignment.course_code}"
+            logger.debug(
+                "Successfully processed course assignment %d: %s",
+                i + 1,
+                assignment.course_code,
             )
         except Exception as e:
             logger.error(
-                f"Error converting course assignment {i+1} in study plan {name}: {str(e)}",
+                "Error converting course assignment %d in study plan %s: %s",
+                i + 1,
+                name,
+                e,
                 exc_info=True,
             )
 
-    logger.info(f"Successfully processed {len(course_assignments)} course assignments")
+    logger.info("Successfully processed %d course assignments", len(course_assignments))
 
-    # Log summary
-    total_lecture_groups = sum(ca.lecture_groups for ca in course_assignments)
-    total_lab_groups = sum(ca.lab_groups or 0 for ca in course_assignments)
+    # Log summary — the group totals exist only for these lines, so skip
+    # both O(N) sums when INFO is suppressed
+    if logger.isEnabledFor(logging.INFO):
+        total_lecture_groups = sum(ca.lecture_groups for ca in course_assignments)
+        total_lab_groups = sum(ca.lab_groups or 0 for ca in course_assignments)
 
-    logger.info(f"\n=== STUDY PLAN CONVERSION SUMMARY ===")
-    logger.info(f"Study plan: {name}")
-    logger.info(f"Academic level: {academic_level}")
-    logger.info(f"Expected students: {expected_students}")
-    logger.info(f"Course assignments: {len(course_assignments)}")
-    logger.info(f"Total lecture groups: {total_lecture_groups}")
-    logger.info(f"Total lab groups: {total_lab_groups}")
+        logger.info("\n=== STUDY PLAN CONVERSION SUMMARY ===")
+        logger.info("Study plan: %s", name)
+        logger.info("Academic level: %s", academic_level)
+        logger.info("Expected students: %s", expected_students)
+        logger.info("Course assignments: %d", len(course_assignments))
+        logger.info("Total lecture groups: %d", total_lecture_groups)
+        logger.info("Total lab groups: %d", total_lab_groups)
 
     # Create the StudyPlan object
     try:
@@ -456,9 +603,13 @@ def convert_api_study_plan_detail(
             course_assignments=course_assignments,
         )
 
-        logger.info(f"Successfully created StudyPlan object")
+        # Validation is opt-in so bulk loads skip the per-object checks
+        if os.environ.get("SCHEDU_VALIDATE"):
+            study_plan.validate()
+
+        logger.info("Successfully created StudyPlan object")
         return study_plan
 
     except Exception as e:
-        logger.error(f"Failed to create StudyPlan object: {str(e)}", exc_info=True)
+        logger.error("Failed to create StudyPlan object: %s", e, exc_info=True)
         raise
@@ -10,11 +10,15 @@ def get_room_key(room: Union[Hall, Lab]) -> Tuple[str, int]:
     """
     Get composite key for a room that distinguishes between halls and labs.
 
+    Deliberately uncached: rooms are rebuilt on every generation run, so a
+    process-global cache keyed on object identity could hand a recycled
+    address the previous run's key. With ROOM_TYPE a class attribute the
+    body is just two attribute loads anyway.
+
     Args:
         room: Hall or Lab object
 
     Returns:
         Tuple of (room_type, room_id) where room_type is 'hall' or 'lab'
     """
-    room_type = "hall" if isinstance(room, Hall) else "lab"
-    return (room_type, room.id)
+    return (room.ROOM_TYPE, room.id)
@@ -2,23 +2,49 @@
 
 
 from datetime import time
+from functools import lru_cache
 
 from models.time_preferences import Day, TimePreference
 
 
+# Day members by name — one dict probe per conversion instead of a scan
+# over the enum
+_DAY_BY_NAME = {day.name: day for day in Day}
+
+
 def convert_api_day_to_enum(day_str: str) -> Day:
     """Convert day string from API to Day enum"""
-    day_str = day_str.upper()
-    for day in Day:
-        if day.name == day_str:
-            return day
-    raise ValueError(f"Unknown day: {day_str}")
+    day = _DAY_BY_NAME.get(day_str.upper())
+    if day is None:
+        raise ValueError(f"Unknown day: {day_str.upper()}")
+    return day
 
 
+@lru_cache(maxsize=1440)
 def convert_api_time_to_time_object(time_str: str) -> time:
-    """Convert time string from API (HH:MM format) to time object"""
-    hours, minutes = map(int, time_str.split(":"))
-    return time(hours, minutes)
+    """Convert time string from API (HH:MM format) to time object.
+
+    The format is fixed-width, so the fields are sliced out directly, and
+    with at most 1440 distinct HH:MM values repeat timestamps come back
+    from the cache as shared immutable time objects.
+    """
+    try:
+        return time(int(time_str[:2]), int(time_str[3:5]))
+    except ValueError:
+        # Not zero-padded (e.g. "9:00") — fall back to splitting
+        hours, minutes = map(int, time_str.split(":"))
+        return time(hours, minutes)
+
+
+@lru_cache(maxsize=4096)
+def _make_time_pref(day: Day, start_time: time, end_time: time) -> TimePreference:
+    """Shared TimePreference per (day, start, end) triple.
+
+    Preferences are value objects that are never mutated after creation
+    (the seeded labs already share one availability list), so repeated
+    API rows can reuse a single instance instead of allocating a new one.
+    """
+    return TimePreference(day, start_time, end_time)
 
 
 def convert_api_time_preference(time_pref_data: dict) -> TimePreference:
@@ -27,4 +53,4 @@ def convert_api_time_preference(time_pref_data: dict) -> TimePreference:
     start_time = convert_api_time_to_time_object(time_pref_data["startTime"])
     end_time = convert_api_time_to_time_object(time_pref_data["endTime"])
 
-    return TimePreference(day, start_time, end_time)
+    return _make_time_pref(day, start_time, end_time)